@@ -22,9 +22,9 @@ try:
     sid_data = {
         1: [1]
     }
-    # Length: サーボ一つ分のデータ(VID+Data)のバイト数を指定。
-    # Length = VID(1) + Data(1) = 2
-    futaba.burst_write(Futaba.ADDR_TORQUE_ENABLE, 2, sid_data)
+    # Length: サーボ一つ分のデータのバイト数を指定。(VIDは含まない)
+    # Length = Data(1) = 1
+    futaba.burst_write(Futaba.ADDR_TORQUE_ENABLE, 1, sid_data)
 
     # 色んな角度にバースト設定
     for position_degree in [0, 50, 0, -50, 0]:
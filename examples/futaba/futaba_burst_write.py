@@ -2,6 +2,7 @@
 # encoding: utf-8
 
 import sys
+import struct
 import time
 import logging
 
@@ -22,23 +23,21 @@ try:
     sid_data = {
         1: [1]
     }
-    # Length: サーボ一つ分のデータ(VID+Data)のバイト数を指定。
-    # Length = VID(1) + Data(1) = 2
-    futaba.burst_write(Futaba.ADDR_TORQUE_ENABLE, 2, sid_data)
+    # Length: サーボ一つ分のデータのバイト数を指定。(VIDは含まない)
+    # Length = Data(1) = 1
+    futaba.burst_write(Futaba.ADDR_TORQUE_ENABLE, 1, sid_data)
 
     # バーストポジション設定
     for position_degree in [0, 50, 0, -50, 0]:
         # ADDR_GOAL_POSITION_L 30 (0x1E), ADDR_GOAL_POSITION_H 31 (0x1F) なので
         # AddressにはADDR_GOAL_POSITION_Lを指定してDataを2バイト書き込む
-        position_hex = format(int(position_degree * 10) & 0xffff, '04x')
-        position_hex_h = int(position_hex[0:2], 16)
-        position_hex_l = int(position_hex[2:4], 16)
+        position_data = struct.pack('<H', int(position_degree * 10) & 0xffff)
         sid_data = {
             # サーボID: データ
-            1: [position_hex_l, position_hex_h]
+            1: position_data
         }
-        # Length = VID(1) + Data(2) = 3
-        futaba.burst_write(Futaba.ADDR_GOAL_POSITION_L, 3, sid_data)
+        # Length = Data(2) = 2
+        futaba.burst_write(Futaba.ADDR_GOAL_POSITION_L, 2, sid_data)
 
         # 1秒待機
         time.sleep(1.0)
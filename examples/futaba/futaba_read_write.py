@@ -2,6 +2,7 @@
 # encoding: utf-8
 
 import sys
+import struct
 import time
 import logging
 
@@ -19,7 +20,7 @@ try:
 
     # 電圧をreadで取得
     response_data = futaba.read(1, Futaba.ADDR_VOLTAGE_L, 2)
-    voltage = int.from_bytes(response_data, 'little', signed=True)
+    voltage = struct.unpack_from('<h', response_data, 0)[0]
     voltage /= 100
     print('Voltage: {}(V)'.format(voltage))
 
@@ -30,10 +31,8 @@ try:
     for position_degree in [0, 50, 0, -50, 0]:
         # ADDR_GOAL_POSITION_L 30 (0x1E), ADDR_GOAL_POSITION_H 31 (0x1F) なので
         # AddressにはADDR_GOAL_POSITION_Lを指定してDataを2バイト書き込む
-        position_hex = format(int(position_degree * 10) & 0xffff, '04x')
-        position_hex_h = int(position_hex[0:2], 16)
-        position_hex_l = int(position_hex[2:4], 16)
-        futaba.write(1, Futaba.ADDR_GOAL_POSITION_L, [position_hex_l, position_hex_h])
+        position_data = struct.pack('<H', int(position_degree * 10) & 0xffff)
+        futaba.write(1, Futaba.ADDR_GOAL_POSITION_L, position_data)
 
         # 1秒待機
         time.sleep(1.0)
@@ -15,6 +15,12 @@ logger = logging.getLogger(__name__)
 # シリアルポートの送信バッファサイズ
 MAX_COMMAND_QUEUE_LENGTH = 1024
 
+# 遅延送信中のコマンドバッファをフラッシュするサイズ(bytes)
+TX_BUFFER_FLUSH_SIZE = 1024
+
+# 受信バッファの初期サイズ(bytes)
+RECEIVE_BUFFER_SIZE = 512
+
 
 class DefaultCommandHandler(ICommandHandler):
     """
@@ -43,6 +49,16 @@ class DefaultCommandHandler(ICommandHandler):
     # レスポンスデータを受信完了したかをチェックする関数
     function_is_complete_response = None
 
+    # 受信途中のレスポンスデータから受信完了に必要なバイト数を取得する関数
+    function_get_response_length = None
+
+    # 遅延送信中のコマンドバッファ (スレッドごとに持ち、bufferがNoneなら即時送信)
+    # 他のスレッドのコマンドがまとめ送信に混ざらず、flush()の入れ替えも競合しない
+    tx_local = None
+
+    # 受信バッファ (レスポンス受信のたびに使い回す)
+    receive_buffer = None
+
     def __init__(self, serial_interface: ISerialInterface, function_is_complete_response, buffer_size=1024):
         """初期化
 
@@ -61,6 +77,12 @@ class DefaultCommandHandler(ICommandHandler):
 
         # コマンド送信バッファ初期化
         self.command_queue = deque([], self.command_queue_size)
+
+        # 受信バッファ初期化
+        self.receive_buffer = bytearray(RECEIVE_BUFFER_SIZE)
+
+        # 遅延送信用のスレッドごとのコマンドバッファ初期化
+        self.tx_local = threading.local()
         self.__connect(serial_interface)
 
         # コマンド送信バッファチェック用スレッドを開始
@@ -77,42 +99,79 @@ class DefaultCommandHandler(ICommandHandler):
 
         self.serial_interface = serial_interface
 
-    def __send_command(self, data, recv_callback=None):
+    def __send_command(self, data, recv_callback=None, response_count=1):
         """実際にコマンド送信バッファの中から取り出したコマンドを送信する
 
         :param data:
         :param recv_callback: 受信データのコールバック。レスポンスがあるリクエストはrecv_callbackを設定する必要あり
+        :param response_count: レスポンスのパケット数。複数の場合は連結してrecv_callbackに渡す
         :return:
         """
 
-        byte_data = bytearray(data)
+        # bytes/bytearray/memoryviewはコピーせずにそのまま送信する (listなどの場合のみ変換)
+        if isinstance(data, (bytes, bytearray, memoryview)):
+            byte_data = data
+        else:
+            byte_data = bytearray(data)
 
         if self.serial_interface.is_open:
             # データ送信
             self.serial_interface.write(byte_data)
 
-            logger.debug('Sent data: ' + get_printable_hex(byte_data))
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug('Sent data: %s', get_printable_hex(byte_data))
 
             if recv_callback is not None:
-                start = time.time()
-
-                # データを受信する
-                response = self.serial_interface.read()
-
-                # データが完全に受信できていないのであれば更に受信する
-                while not self.function_is_complete_response(response):
-                    response += self.serial_interface.read()
-
-                    # タイムアウトチェック
-                    elapsed_time = time.time() - start
-                    if elapsed_time > self.RECEIVE_DATA_TIMEOUT_SEC:
+                # データを受信する (複数パケットの場合もタイムアウトは全体で1回分)
+                deadline = time.time() + self.RECEIVE_DATA_TIMEOUT_SEC
+                response = self.__receive_response(deadline)
+                for _ in range(response_count - 1):
+                    # タイムアウトしたら残りのパケットは待たない
+                    if time.time() > deadline:
                         break
+                    response += self.__receive_response(deadline)
 
-                logger.debug('Response data: ' + get_printable_hex(response))
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug('Response data: %s', get_printable_hex(response))
 
                 # 別スレッドでコールバックを呼ぶ（コールバックでcloseされたりとかもするので）
                 threading.Thread(target=recv_callback, args=(response,)).start()
 
+    def __receive_response(self, deadline):
+        """レスポンスデータを受信する
+        受信バッファに直接書き込み、受信完了後にレスポンスデータとしてコピーする
+        必要なバイト数がわかる場合は、残りのデータを1回でまとめて受信する
+
+        :param deadline: 受信を打ち切る時刻 (time.time()の値)
+        :return:
+        """
+
+        view = memoryview(self.receive_buffer)
+        size = 0
+
+        # データが完全に受信できていないのであれば更に受信する
+        while not self.function_is_complete_response(view[:size]):
+            # 受信するバイト数 (わからなければ1バイトずつ)
+            read_size = 1
+            if self.function_get_response_length is not None:
+                response_length = self.function_get_response_length(view[:size])
+                if response_length is not None and response_length > size:
+                    read_size = response_length - size
+
+            # 受信バッファが足りなければ拡張する
+            if size + read_size > len(view):
+                self.receive_buffer = bytearray(max(len(view) * 2, size + read_size))
+                self.receive_buffer[:size] = view[:size]
+                view = memoryview(self.receive_buffer)
+
+            size += self.serial_interface.read_into(view[size:size + read_size])
+
+            # タイムアウトチェック
+            if time.time() > deadline:
+                break
+
+        return bytes(view[:size])
+
     def __polling_command_queue(self):
         """コマンド送信バッファの監視スレッドで動作する関数
         バッファのサイズをチェックし、コマンドがあればそれを送信する
@@ -123,24 +182,34 @@ class DefaultCommandHandler(ICommandHandler):
         while self.enable_polling or (not self.close_force and len(self.command_queue) > 0):
             if len(self.command_queue) > 0:
                 command = self.command_queue.pop()
-                self.__send_command(command['data'], command['recv_callback'])
+                self.__send_command(command['data'], command['recv_callback'], command['response_count'])
 
-    def add_command(self, data, recv_callback=None):
+    def __check_command_queue(self):
+        """送信バッファにコマンドを追加できるかチェックする
+
+        :return:
+        """
+
+        if len(self.command_queue) > MAX_COMMAND_QUEUE_LENGTH:
+            raise CommandBufferOverflowException('コマンドバッファの最大サイズ(%d)を超えました' % self.command_queue_size)
+        elif not self.enable_polling:
+            raise NotEnablePollingCommandException('コマンドバッファのポーリング終了後にコマンド追加はできません')
+
+    def __add_command_queue(self, data, recv_callback=None, response_count=1):
         """送信するコマンドを送信バッファに追加する
 
         :param data:
         :param recv_callback:
+        :param response_count:
         :return:
         """
 
         try:
-            if len(self.command_queue) > MAX_COMMAND_QUEUE_LENGTH:
-                raise CommandBufferOverflowException('コマンドバッファの最大サイズ(%d)を超えました' % self.command_queue_size)
-            elif not self.enable_polling:
-                raise NotEnablePollingCommandException('コマンドバッファのポーリング終了後にコマンド追加はできません')
+            self.__check_command_queue()
             command_data = {
                 'data': data,
-                'recv_callback': recv_callback
+                'recv_callback': recv_callback,
+                'response_count': response_count
             }
             self.command_queue.insert(0, command_data)
             # logger.debug('Command data: ' + str(command_data))
@@ -148,6 +217,65 @@ class DefaultCommandHandler(ICommandHandler):
         except IndexError:
             return False
 
+    def add_command(self, data, recv_callback=None, response_count=1):
+        """送信するコマンドを送信バッファに追加する
+        遅延送信中はレスポンスなしのコマンドを溜めておき、flush()でまとめて送信する
+
+        :param data:
+        :param recv_callback:
+        :param response_count: レスポンスのパケット数 (Sync Readなど複数のサーボが返信する場合)
+        :return:
+        """
+
+        tx_buffer = getattr(self.tx_local, 'buffer', None)
+        if tx_buffer is not None:
+            if recv_callback is None:
+                # 溜めたコマンドが送信されないまま終わらないように、追加できる状態かを先にチェック
+                self.__check_command_queue()
+                tx_buffer.extend(data)
+                if len(tx_buffer) >= TX_BUFFER_FLUSH_SIZE:
+                    self.flush()
+                return True
+
+            # レスポンスありのコマンドは送信順序を保つため、溜めたコマンドを先に送信する
+            self.flush()
+
+        return self.__add_command_queue(data, recv_callback, response_count)
+
+    def begin_batch(self):
+        """呼び出したスレッドでレスポンスなしのコマンドの遅延送信を開始する
+
+        :return: 遅延送信を新たに開始したか
+        """
+
+        if getattr(self.tx_local, 'buffer', None) is not None:
+            return False
+
+        self.tx_local.buffer = bytearray()
+        return True
+
+    def flush(self):
+        """呼び出したスレッドで遅延送信中のコマンドをまとめて1つのコマンドとして送信バッファに追加する
+
+        :return:
+        """
+
+        data = getattr(self.tx_local, 'buffer', None)
+        if data:
+            self.tx_local.buffer = bytearray()
+            self.__add_command_queue(data)
+
+    def end_batch(self):
+        """呼び出したスレッドで遅延送信中のコマンドを送信し、遅延送信を終了する
+
+        :return:
+        """
+
+        try:
+            self.flush()
+        finally:
+            self.tx_local.buffer = None
+
     def close(self, force=False):
         """接続をクローズする。
         force=False ならバッファにあるコマンドをすべて処理してからクローズ
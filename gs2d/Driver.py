@@ -2,26 +2,81 @@
 # encoding: utf-8
 
 from abc import ABCMeta, abstractmethod
+from contextlib import contextmanager
 from .ICommandHandler import ICommandHandler
 from .ISerialInterface import ISerialInterface
 import logging
 
-try:
-    import struct
-except:
-    # For MicroPython
-    import ustruct as struct
-
 # ロガー
 logger = logging.getLogger(__name__)
 
 
+def _set_future_result(f, result):
+    """Futureに結果を設定する (キャンセル済みなどで完了済みなら何もしない)
+
+    :param f:
+    :param result:
+    :return:
+    """
+
+    if not f.done():
+        f.set_result(result)
+
+
+def async_method(sync_method):
+    """同期版の関数(callback引数あり)からasync版の関数を生成する
+
+    :param sync_method: 同期版の関数
+    :return:
+    """
+
+    method_name = sync_method.__name__
+
+    # loop以外の引数の数 (self, callbackを除く)
+    arg_count = sync_method.__code__.co_argcount - 2
+
+    def method(self, *args, loop=None, **kwargs):
+        # loopが位置引数で渡された場合
+        if len(args) > arg_count:
+            args, loop = args[:arg_count], args[arg_count]
+
+        f, callback = self.async_wrapper(loop)
+        getattr(self, method_name)(*args, callback=callback, **kwargs)
+        return f
+
+    method.__name__ = method_name + '_async'
+    method.__qualname__ = sync_method.__qualname__ + '_async'
+    method.__doc__ = (sync_method.__doc__ or '').strip().split('\n')[0] + ' async版'
+    return method
+
+
 class Driver(metaclass=ABCMeta):
     """
     サーボモータとのデータ送受信管理および各種コントロール関数の抽象クラス
     """
 
-    command_handler = None
+    # インスタンス変数 (__dict__を持たないようにする)
+    __slots__ = ('command_handler',)
+
+    # 対応していない操作 (呼び出すとNotSupportExceptionになる、または未実装の関数名。サブクラスで定義)
+    NOT_SUPPORTED_OPS = frozenset()
+
+    # 対応している操作の関数名 (サブクラスの定義時に設定)
+    # if 'burst_read' in driver.SUPPORTED_OPS: のようにtry/exceptなしで対応をチェックできる
+    SUPPORTED_OPS = frozenset()
+
+    # サーボの操作ではない関数 (SUPPORTED_OPSに含めない)
+    NON_OPERATION_METHODS = frozenset(['close', 'is_complete_response'])
+
+    def __init_subclass__(cls, **kwargs):
+        """サブクラスの定義時に対応している操作を設定
+
+        :param kwargs:
+        :return:
+        """
+
+        super().__init_subclass__(**kwargs)
+        cls.SUPPORTED_OPS = frozenset(Driver.__abstractmethods__) - cls.NON_OPERATION_METHODS - cls.NOT_SUPPORTED_OPS
 
     def __init__(self, serial_interface: ISerialInterface, command_handler_class: ICommandHandler = None):
         """初期化
@@ -34,6 +89,9 @@ class Driver(metaclass=ABCMeta):
 
         self.command_handler = command_handler_class(serial_interface, self.is_complete_response)
 
+        # レスポンスの長さがわかる場合は残りをまとめて受信できるようにする
+        self.command_handler.function_get_response_length = self.get_response_length
+
     @staticmethod
     def async_wrapper(loop=None):
         """async対応するための関数
@@ -48,14 +106,32 @@ class Driver(metaclass=ABCMeta):
             loop = asyncio.get_event_loop()
 
         f = loop.create_future()
+        call_soon_threadsafe = loop.call_soon_threadsafe
 
         def callback(result):
-            loop.call_soon_threadsafe(
-                lambda: f.set_result(result)
-            )
+            # コールバックはコマンドハンドラーのスレッドから呼ばれるので、イベントループのスレッドで結果を設定する
+            call_soon_threadsafe(_set_future_result, f, result)
 
         return f, callback
 
+    @contextmanager
+    def batched(self):
+        """withブロック内のレスポンスを待たないコマンド(バースト書き込みなど)をまとめて1回で送信する
+
+        with driver.batched():
+            driver.burst_write(address, length, sid_data_1)
+            driver.burst_write(address, length, sid_data_2)
+
+        :return:
+        """
+
+        started = self.command_handler.begin_batch()
+        try:
+            yield self
+        finally:
+            if started:
+                self.command_handler.end_batch()
+
     @staticmethod
     def get_bytes(data, byte_length):
         """intのデータを指定のバイト数のlittle-endianデータに変換
@@ -65,16 +141,16 @@ class Driver(metaclass=ABCMeta):
         :return:
         """
 
-        data_hex = struct.pack('<H', int(data) & (2 ** (8 * byte_length) - 1))
-        data_bytes = []
+        return list((int(data) & ((1 << (8 * byte_length)) - 1)).to_bytes(byte_length, 'little'))
 
-        for i in range(byte_length):
-            if i < len(data_hex):
-                data_bytes.append(int(struct.unpack('<B', data_hex[i:i + 1])[0]))
-            else:
-                data_bytes.append(0)
+    def get_response_length(self, response_data):
+        """受信途中のレスポンスデータから、受信完了に必要なバイト数を取得
+        ヘッダーが揃っていない場合はヘッダーのバイト数、わからない場合はNone
 
-        return data_bytes
+        :param response_data:
+        :return:
+        """
+        return None
 
     @abstractmethod
     def is_complete_response(self, response_data):
@@ -303,4 +379,11 @@ class Driver(metaclass=ABCMeta):
 
     @abstractmethod
     def burst_write(self, address, length, sid_data):
+        """複数サーボに一括で書き込み
+
+        :param address: 書き込み先アドレス
+        :param length: サーボ1つ分のデータのバイト数 (サーボIDは含まない。全ドライバー共通)
+        :param sid_data: {サーボID: データ(lengthバイト)}
+        :return:
+        """
         raise NotImplementedError()
@@ -1,10 +1,17 @@
 import asyncio
-import time
 import logging
+import threading
 
-from .Driver import Driver
+try:
+    import struct
+except:
+    # For MicroPython
+    import ustruct as struct
+
+from .ICommandHandler import ICommandHandler
+from .ISerialInterface import ISerialInterface
+from .Driver import Driver, async_method
 from .Util import ReceiveDataTimeoutException, NotSupportException, BadInputParametersException, WrongCheckSumException
-from .Util import InvalidResponseDataException
 from .Util import get_printable_hex
 
 # ロガー
@@ -12,11 +19,188 @@ logger = logging.getLogger(__name__)
 
 RECEIVE_DATA_TIMEOUT_SEC = 19
 
+# little-endianデータとの変換
+_pack_u16 = struct.Struct('<H').pack
+_unpack_u8 = struct.Struct('<B').unpack
+_unpack_u16 = struct.Struct('<H').unpack
+_unpack_s16 = struct.Struct('<h').unpack
+
+# NumPyでまとめて変換するバーストコマンドのサーボ数の閾値
+NUMPY_BURST_THRESHOLD = 8
+
+# NumPy, Numba (読み込みに時間がかかるため、ドライバーの初期化時に_load_accelerators()で読み込む)
+np = None
+_encode_burst_positions = None
+_accelerators_loaded = False
+
+# 有効なServo ID (1~127)
+_VALID_SIDS = frozenset(range(1, 128))
+
+
+def _encode_burst_positions_loop(sids, positions, out):
+    """バーストでのポジション設定のVID+Data部を生成 (Numbaでコンパイルする関数の元)
+
+    :param sids: サーボID (int64配列)
+    :param positions: 位置(度) (float64配列)
+    :param out: 書き込み先 (uint8配列, サーボ数*3bytes)
+    :return: 書き込んだデータのXOR
+    """
+
+    checksum = 0
+    for i in range(sids.size):
+        # 設定可能な範囲は-150.0 度~+150.0 度。0.1度単位に変換
+        position = int(min(max(positions[i], -150.0), 150.0) * 10)
+
+        offset = i * 3
+        out[offset] = sids[i]
+        out[offset + 1] = position & 0xFF
+        out[offset + 2] = (position >> 8) & 0xFF
+        checksum ^= out[offset] ^ out[offset + 1] ^ out[offset + 2]
+    return checksum
+
+
+def _load_accelerators():
+    """NumPy, Numbaを読み込み、Numbaの関数をコンパイル(キャッシュから読み込み)しておく
+    import時間を増やさないようにドライバーの初期化時に呼び出し、制御ループ中の最初の呼び出しでコンパイルしないようにする
+
+    :return:
+    """
+
+    global np, _encode_burst_positions, _accelerators_loaded
+
+    if _accelerators_loaded:
+        return
+    _accelerators_loaded = True
+
+    try:
+        import numpy
+    except ImportError:
+        # NumPyがない環境では通常の処理を使う
+        return
+    np = numpy
+
+    try:
+        from numba import njit
+    except ImportError:
+        # Numbaがない環境ではNumPyの処理を使う
+        return
+
+    encode_burst_positions = njit(cache=True)(_encode_burst_positions_loop)
+    encode_burst_positions(np.zeros(1, dtype=np.int64), np.zeros(1, dtype=np.float64), np.zeros(3, dtype=np.uint8))
+    _encode_burst_positions = encode_burst_positions
+
+
+# レスポンスデータの変換関数
+# _get_functionでデータ長分だけ切り出して渡すので、ここではデータ長をチェックしない
+def _parse_bool(response_data):
+    """1byteのON/OFFのレスポンスデータを変換
+
+    :param response_data:
+    :return:
+    """
+
+    return response_data[0] == 0x01
+
+
+def _parse_uint8(response_data):
+    """1byteの符号なし整数のレスポンスデータを変換
+
+    :param response_data:
+    :return:
+    """
+
+    return _unpack_u8(response_data)[0]
+
+
+def _parse_int16(response_data):
+    """2bytesの符号あり整数のレスポンスデータを変換
+
+    :param response_data:
+    :return:
+    """
+
+    return _unpack_s16(response_data)[0]
+
+
+def _parse_int16_div10(response_data):
+    """2bytesの符号あり整数(0.1単位)のレスポンスデータを変換
+
+    :param response_data:
+    :return:
+    """
+
+    return _parse_int16(response_data) / 10
+
+
+def _parse_uint16(response_data):
+    """2bytesの符号なし整数のレスポンスデータを変換
+
+    :param response_data:
+    :return:
+    """
+
+    return _unpack_u16(response_data)[0]
+
+
+def _parse_uint16_div100(response_data):
+    """2bytesの符号なし整数(0.01単位)のレスポンスデータを変換
+
+    :param response_data:
+    :return:
+    """
+
+    return _parse_uint16(response_data) / 100
+
+
+def _parse_int16_div100(response_data):
+    """2bytesの符号あり整数(0.01単位)のレスポンスデータを変換
+
+    :param response_data:
+    :return:
+    """
+
+    return _parse_int16(response_data) / 100
+
+
+def _memory_map_getter(name, address, flag, length, response_process, doc):
+    """メモリーマップの指定アドレスを読み込むGet系の関数を生成する
+    アドレス, フラグ, データ長, 変換関数は生成した関数に埋め込まれる
+
+    :param name: 関数名
+    :param address: 読み込むアドレス
+    :param flag: フラグ
+    :param length: データ長
+    :param response_process: レスポンスデータの変換関数
+    :param doc: 関数の説明
+    :return:
+    """
+
+    def getter(self, sid, callback=None):
+        # サーボIDのチェック
+        self._check_sid(sid)
+
+        return self._get_function(address, flag, length, response_process, sid=sid, callback=callback)
+
+    getter.__name__ = name
+    getter.__qualname__ = 'Futaba.' + name
+    getter.__doc__ = doc
+    return getter
+
+
 class Futaba(Driver):
     """Futabaのシリアルサーボクラス
 
     """
 
+    __slots__ = ()
+
+    # 対応していない操作
+    NOT_SUPPORTED_OPS = frozenset([
+        'set_speed', 'set_limit_temperature',
+        'get_burst_positions', 'get_burst_positions_async',
+        'burst_read', 'burst_read_async',
+    ])
+
     # アドレス空間
     ADDR_MODEL_NUMBER_L = 0  # 0x00
     ADDR_FIRMWARE_VERSION = 2  # 0x02
@@ -76,24 +260,49 @@ class Futaba(Driver):
     BAUD_RATE_INDEX_153600 = 0x08
     BAUD_RATE_INDEX_230400 = 0x09
 
-    def __init__(self, serial_interface):
+    # 有効な通信速度ID
+    _VALID_BAUD_RATE_IDS = frozenset(range(BAUD_RATE_INDEX_9600, BAUD_RATE_INDEX_230400 + 1))
+
+    def __init__(self, serial_interface: ISerialInterface, command_handler_class: ICommandHandler = None):
         """初期化
         """
 
-        super(Futaba, self).__init__(serial_interface)
+        # NumPy, Numbaの読み込み (初回のみ)
+        _load_accelerators()
 
-    def is_complete_response(self, response_data):
+        super(Futaba, self).__init__(serial_interface, command_handler_class)
+
+    @staticmethod
+    def is_complete_response(response_data):
         """レスポンスデータをすべて受信できたかチェック"""
-        # print('#########', response_data)
 
         # Header, ID, Flags, Address, Length, Count, Data, Sum で7バイトは最低限ある
+        size = len(response_data)
+        return size >= 6 and size == 8 + response_data[5]
+
+    def get_response_length(self, response_data):
+        """受信途中のレスポンスデータから、受信完了に必要なバイト数を取得
+
+        :param response_data:
+        :return:
+        """
+
+        # Header, ID, Flags, Address, Length までの6バイト
         if len(response_data) < 6:
-            return False
-        else:
-            # カウント取得
-            count = response_data[5]
-            # print('####', count, len(response_data))
-            return len(response_data) == (8 + count)
+            return 6
+
+        # Count, Data, Sum のバイト数を足す
+        return 8 + response_data[5]
+
+    def close(self, force=False):
+        """閉じる
+
+        :param force:
+        :return:
+        """
+
+        if self.command_handler:
+            self.command_handler.close()
 
     @staticmethod
     def __get_checksum(data):
@@ -109,22 +318,36 @@ class Futaba(Driver):
         return checksum
 
     @staticmethod
-    def __check_sid(sid):
+    def _check_sid(sid):
         """Servo IDのレンジをチェック
+        モジュールレベルの_memory_map_getterで生成したGet系の関数からも呼ぶため、シングルアンダースコアにしている
 
         :param sid:
         :return:
         """
 
-        if sid < 1 or sid > 127:
+        if sid not in _VALID_SIDS:
             raise BadInputParametersException('sid: %d がレンジ外です。1から127のIDを設定してください。' % sid)
 
-    def __generate_command(self, sid, addr, data=None, flag=0, count=1, length=None):
+    @staticmethod
+    def __check_sids(sids):
+        """複数のServo IDのレンジをまとめてチェック
+
+        :param sids:
+        :return:
+        """
+
+        if not _VALID_SIDS.issuperset(sids):
+            # レンジ外のIDを探してエラーにする
+            for sid in sids:
+                Futaba._check_sid(sid)
+
+    def __generate_command(self, sid, addr, data=b'', flag=0, count=1, length=None):
         """コマンド生成
 
         :param sid:  Servo ID
         :param addr:
-        :param data:
+        :param data: bytes/bytearray
         :param flag:
         :param count:
         :param length:
@@ -143,33 +366,15 @@ class Futaba(Driver):
         # Checksum: 送信データの確認用のチェックサムで、パケットのIDからDataの末尾までを1バイトずつ
         #           XORした値を指定します。
 
-        command = []
-
-        # Header
-        command.extend([0xFA, 0xAF])
-
-        # ID
-        command.append(sid)
-
-        # Flag
-        command.append(flag)
-
-        # Address
-        command.append(addr)
-
         # Length
-        if length is not None:
-            command.append(length)
-        elif data is not None:
-            command.append(len(data))
-        else:
-            command.append(0)
+        if length is None:
+            length = len(data) if data else 0
 
-        # Count
-        command.append(count)
+        # Header, ID, Flag, Address, Length, Count
+        command = bytearray((0xFA, 0xAF, sid, flag, addr, length, count))
 
         # Data
-        if data is not None and len(data) > 0:
+        if data:
             command.extend(data)
 
         # Checksum
@@ -198,25 +403,8 @@ class Futaba(Driver):
         # Sum:     送信データの確認用のチェックサムで、パケットのIDからDataの末尾までを1バイトずつ
         #          XORした値を指定します。
 
-        command = []
-
-        # Header
-        command.extend([0xFA, 0xAF])
-
-        # ID
-        command.append(0)
-
-        # Flag
-        command.append(0)
-
-        # Address
-        command.append(addr)
-
-        # Length
-        command.append(length)
-
-        # Count
-        command.append(len(vid_data_dict))
+        # Header, ID, Flag, Address, Length, Count
+        command = bytearray((0xFA, 0xAF, 0, 0, addr, length, len(vid_data_dict)))
 
         # Data
         for sid, data in vid_data_dict.items():
@@ -229,8 +417,47 @@ class Futaba(Driver):
 
         return command
 
-    def __get_function(self, address, flag, length, response_process, sid=1, callback=None):
+    def __generate_burst_positions_command_numpy(self, sid_target_positions):
+        """バーストでのポジション設定コマンドをNumPyでまとめて生成
+
+        :param sid_target_positions:
+        :return:
+        """
+
+        count = len(sid_target_positions)
+        sids = np.fromiter(sid_target_positions.keys(), dtype=np.int64, count=count)
+        positions = np.fromiter(sid_target_positions.values(), dtype=np.float64, count=count)
+
+        # サーボIDのチェック
+        invalid_sids = sids[(sids < 1) | (sids > 127)]
+        if invalid_sids.size > 0:
+            self._check_sid(int(invalid_sids[0]))
+
+        # Header, ID, Flag, Address, Length, Count
+        command = bytearray(7 + count * 3 + 1)
+        command[:7] = bytes((0xFA, 0xAF, 0, 0, self.ADDR_GOAL_POSITION_L, 3, count))
+
+        # VID+Data (ヘッダー部のチェックサムはPythonで、データ部のXORはNumba/NumPyで計算)
+        checksum = self.__get_checksum(command[:7])
+        if _encode_burst_positions is not None:
+            checksum ^= int(_encode_burst_positions(sids, positions, np.frombuffer(command, dtype=np.uint8)[7:-1]))
+        else:
+            # 設定可能な範囲は-150.0 度~+150.0 度。0.1度単位に変換
+            vid_data = np.empty(count, dtype=np.dtype([('sid', 'u1'), ('position', '<i2')]))
+            vid_data['sid'] = sids
+            vid_data['position'] = np.clip(positions, -150, 150) * 10
+            vid_data_bytes = vid_data.tobytes()
+            checksum ^= int(np.bitwise_xor.reduce(np.frombuffer(vid_data_bytes, dtype=np.uint8)))
+            command[7:-1] = vid_data_bytes
+
+        # Checksum
+        command[-1] = checksum
+
+        return command
+
+    def _get_function(self, address, flag, length, response_process, sid=1, callback=None):
         """Get系の処理をまとめた関数
+        モジュールレベルの_memory_map_getterで生成したGet系の関数からも呼ぶため、シングルアンダースコアにしている
 
         :param address:
         :param flag:
@@ -258,8 +485,10 @@ class Futaba(Driver):
             recv_data = None
 
             # レスポンスデータのチェックサムが正しいかチェック
-            if self.__get_checksum(response[:-1]) != response[-1]:
-                logger.debug('Check sum error: ' + get_printable_hex(response))
+            response_view = memoryview(response)
+            if self.__get_checksum(response_view[:-1]) != response[-1]:
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug('Check sum error: %s', get_printable_hex(response))
                 is_checksum_error = True
                 return
 
@@ -267,7 +496,8 @@ class Futaba(Driver):
             is_received = True
 
             if len(response) > self.PACKET_DATA_INDEX + length:
-                response_data = response[self.PACKET_DATA_INDEX:self.PACKET_DATA_INDEX + length]
+                # コピーしないようにmemoryviewで切り出す (変換関数には常にlengthバイトのデータを渡す)
+                response_data = response_view[self.PACKET_DATA_INDEX:self.PACKET_DATA_INDEX + length]
                 recv_data = response_process(response_data)
 
             if callback is not None:
@@ -275,55 +505,37 @@ class Futaba(Driver):
             else:
                 data = recv_data
 
+        # 受信処理の完了通知
+        done = threading.Event()
+
+        def recv_callback(response):
+            try:
+                temp_recv_callback(response)
+            finally:
+                done.set()
+
         command = self.__generate_command(sid, address, flag=flag, count=0, length=length)
-        self.add_command(command, recv_callback=temp_recv_callback)
+        self.command_handler.add_command(command, recv_callback=recv_callback)
 
         # コールバックが設定できていたら、コールバックに受信データを渡す
         if callback is None:
-            # 指定以内にサーボからデータを受信できたかをチェック
-            start = time.time()
-            while not is_received:
-                elapsed_time = time.time() - start
-                if elapsed_time > self.RECEIVE_DATA_TIMEOUT_SEC:
-                    raise ReceiveDataTimeoutException(str(self.RECEIVE_DATA_TIMEOUT_SEC) + '秒以内にデータ受信できませんでした')
-                elif is_checksum_error:
-                    raise WrongCheckSumException('受信したデータのチェックサムが不正です')
+            # 指定以内にサーボからデータを受信できたかをチェック (受信処理の完了まで待機する)
+            done.wait(self.command_handler.RECEIVE_DATA_TIMEOUT_SEC)
+            if is_checksum_error:
+                raise WrongCheckSumException('受信したデータのチェックサムが不正です')
+            elif not is_received:
+                raise ReceiveDataTimeoutException(
+                    str(self.command_handler.RECEIVE_DATA_TIMEOUT_SEC) + '秒以内にデータ受信できませんでした'
+                )
 
             return data
         else:
             return True
 
-    def get_torque_enable(self, sid, callback=None):
-        """トルクON取得
+    get_torque_enable = _memory_map_getter('get_torque_enable', ADDR_TORQUE_ENABLE, FLAG30_MEM_MAP_SELECT, 1,
+                                           _parse_bool, 'トルクON取得')
 
-        :param sid:
-        :param callback:
-        :return:
-        """
-
-        # サーボIDのチェック
-        self.__check_sid(sid)
-
-        def response_process(response_data):
-            if response_data is not None and len(response_data) == 1:
-                return response_data[0] == 0x01
-            else:
-                raise InvalidResponseDataException('サーボからのレスポンスデータが不正です')
-
-        return self.__get_function(self.ADDR_TORQUE_ENABLE, self.FLAG30_MEM_MAP_SELECT, 1, response_process,
-                                   sid=sid, callback=callback)
-
-    def get_torque_enable_async(self, sid, loop=None):
-        """トルクON取得async版
-
-        :param sid:
-        :param loop:
-        :return:
-        """
-
-        f, callback = self.__async_wrapper(loop)
-        self.get_torque_enable(sid, callback=callback)
-        return f
+    get_torque_enable_async = async_method(get_torque_enable)
 
     def ping(self, sid, callback=None):
         """サーボにPINGを送る
@@ -340,7 +552,7 @@ class Futaba(Driver):
         # TODO: model_noとversion_firmwareをreadで一気に取得する方式に変更
 
         # サーボIDのチェック
-        self.__check_sid(sid)
+        self._check_sid(sid)
 
         if callback:
             def inner_callback(_sid):
@@ -352,17 +564,7 @@ class Futaba(Driver):
             servo_id = self.get_servo_id(sid)
             return sid == servo_id
 
-    def ping_async(self, sid, loop=None):
-        """サーボにPINGを送る async版
-
-        :param sid:
-        :param loop:
-        :return:
-        """
-
-        f, callback = self.__async_wrapper(loop)
-        self.ping(sid, callback=callback)
-        return f
+    ping_async = async_method(ping)
 
     def set_torque_enable(self, on_off, sid):
         """トルクON/OFF設定
@@ -373,117 +575,31 @@ class Futaba(Driver):
         """
 
         # サーボIDのチェック
-        self.__check_sid(sid)
+        self._check_sid(sid)
 
         # トルクデータ
         torque_data = 0x01 if on_off else 0x00
 
         # コマンド生成
-        command = self.__generate_command(sid, self.ADDR_TORQUE_ENABLE, [torque_data])
+        command = self.__generate_command(sid, self.ADDR_TORQUE_ENABLE, bytes((torque_data,)))
 
         # データ送信バッファに追加
-        self.add_command(command)
+        self.command_handler.add_command(command)
 
-    def get_temperature(self, sid, callback=None):
-        """温度取得（単位: ℃。おおよそ±3℃程度の誤差あり）
+    get_temperature = _memory_map_getter('get_temperature', ADDR_TEMPERATURE_L, FLAG30_MEM_MAP_SELECT, 2, _parse_int16,
+                                         '温度取得（単位: ℃。おおよそ±3℃程度の誤差あり）')
 
-        :param sid:
-        :param callback:
-        :return:
-        """
+    get_temperature_async = async_method(get_temperature)
 
-        # サーボIDのチェック
-        self.__check_sid(sid)
+    get_current = _memory_map_getter('get_current', ADDR_PRESENT_CURRENT_L, FLAG30_MEM_MAP_SELECT, 2, _parse_uint16,
+                                     '電流(現在の負荷)取得 (単位: mA)')
 
-        def response_process(response_data):
-            if response_data is not None and len(response_data) == 2:
-                temperature = int.from_bytes(response_data, 'little', signed=True)
-                return temperature
-            else:
-                raise InvalidResponseDataException('サーボからのレスポンスデータが不正です')
+    get_current_async = async_method(get_current)
 
-        return self.__get_function(self.ADDR_TEMPERATURE_L, self.FLAG30_MEM_MAP_SELECT, 2, response_process,
-                                   sid=sid, callback=callback)
+    get_target_position = _memory_map_getter('get_target_position', ADDR_GOAL_POSITION_L, FLAG30_MEM_MAP_SELECT, 2,
+                                             _parse_int16_div10, '指示位置取得 (単位: 度)')
 
-    def get_temperature_async(self, sid, loop=None):
-        """温度取得 async版（単位: ℃。おおよそ±3℃程度の誤差あり）
-
-        :param sid:
-        :param loop:
-        :return:
-        """
-
-        f, callback = self.__async_wrapper(loop)
-        self.get_temperature(sid, callback=callback)
-        return f
-
-    def get_current(self, sid, callback=None):
-        """電流(現在の負荷)取得 (単位: mA)
-
-        :param sid:
-        :param callback:
-        :return:
-        """
-
-        # サーボIDのチェック
-        self.__check_sid(sid)
-
-        def response_process(response_data):
-            if response_data is not None and len(response_data) == 2:
-                current = int.from_bytes(response_data, 'little', signed=False)
-                return current
-            else:
-                raise InvalidResponseDataException('サーボからのレスポンスデータが不正です')
-
-        return self.__get_function(self.ADDR_PRESENT_CURRENT_L, self.FLAG30_MEM_MAP_SELECT, 2, response_process,
-                                   sid=sid, callback=callback)
-
-    def get_current_async(self, sid, loop=None):
-        """電流(現在の負荷)取得 async版 (単位: mA)
-
-        :param sid:
-        :param loop:
-        :return:
-        """
-
-        f, callback = self.__async_wrapper(loop)
-        self.get_current(sid, callback=callback)
-        return f
-
-    def get_target_position(self, sid, callback=None):
-        """指示位置取得 (単位: 度)
-
-        :param sid:
-        :param callback:
-        :return:
-        """
-
-        # サーボIDのチェック
-        self.__check_sid(sid)
-
-        def response_process(response_data):
-            if response_data is not None and len(response_data) == 2:
-                # 単位は 0.1 度になっているので、度に変換
-                position = int.from_bytes(response_data, 'little', signed=True)
-                position /= 10
-                return position
-            else:
-                raise InvalidResponseDataException('サーボからのレスポンスデータが不正です')
-
-        return self.__get_function(self.ADDR_GOAL_POSITION_L, self.FLAG30_MEM_MAP_SELECT, 2, response_process,
-                                   sid=sid, callback=callback)
-
-    def get_target_position_async(self, sid, loop=None):
-        """指示位置取得 async版 (単位: 度)
-
-        :param sid:
-        :param loop:
-        :return:
-        """
-
-        f, callback = self.__async_wrapper(loop)
-        self.get_target_position(sid, callback=callback)
-        return f
+    get_target_position_async = async_method(get_target_position)
 
     def set_target_position(self, position_degree, sid=1):
         """指示位置設定 (単位: 度。設定可能な範囲は-150.0 度~+150.0 度)
@@ -494,127 +610,33 @@ class Futaba(Driver):
         """
 
         # サーボIDのチェック
-        self.__check_sid(sid)
+        self._check_sid(sid)
 
         # 設定可能な範囲は-150.0 度~+150.0 度
-        if position_degree < -150:
-            position_degree = -150
-        elif position_degree > 150:
-            position_degree = 150
+        position_degree = max(-150, min(150, position_degree))
 
-        position_hex = format(int(position_degree * 10) & 0xffff, '04x')
-        position_hex_h = int(position_hex[0:2], 16)
-        position_hex_l = int(position_hex[2:4], 16)
+        position_data = _pack_u16(int(position_degree * 10) & 0xffff)
 
         # コマンド生成
-        command = self.__generate_command(sid, self.ADDR_GOAL_POSITION_L, [position_hex_l, position_hex_h])
+        command = self.__generate_command(sid, self.ADDR_GOAL_POSITION_L, position_data)
 
         # データ送信バッファに追加
-        self.add_command(command)
+        self.command_handler.add_command(command)
 
-    def get_current_position(self, sid, callback=None):
-        """現在位置取得 (単位: 度)
+    get_current_position = _memory_map_getter('get_current_position', ADDR_PRESENT_POSITION_L, FLAG30_MEM_MAP_SELECT, 2,
+                                              _parse_int16_div10, '現在位置取得 (単位: 度)')
 
-        :param sid:
-        :param callback:
-        :return:
-        """
+    get_current_position_async = async_method(get_current_position)
 
-        # サーボIDのチェック
-        self.__check_sid(sid)
-
-        def response_process(response_data):
-            if response_data is not None and len(response_data) == 2:
-                # 単位は 0.1 度になっているので、度に変換
-                position = int.from_bytes(response_data, 'little', signed=True)
-                position /= 10
-                return position
-            else:
-                raise InvalidResponseDataException('サーボからのレスポンスデータが不正です')
+    get_voltage = _memory_map_getter('get_voltage', ADDR_VOLTAGE_L, FLAG30_MEM_MAP_SELECT, 2, _parse_int16_div100,
+                                     '電圧取得 (単位: V)')
 
-        return self.__get_function(self.ADDR_PRESENT_POSITION_L, self.FLAG30_MEM_MAP_SELECT, 2, response_process,
-                                   sid=sid, callback=callback)
+    get_voltage_async = async_method(get_voltage)
 
-    def get_current_position_async(self, sid, loop=None):
-        """現在位置取得 async版 (単位: 度)
+    get_target_time = _memory_map_getter('get_target_time', ADDR_GOAL_TIME_L, FLAG30_MEM_MAP_SELECT, 2,
+                                         _parse_uint16_div100, '目標位置までのサーボ移動時間を取得 (単位: 秒)')
 
-        :param sid:
-        :param loop:
-        :return:
-        """
-
-        f, callback = self.__async_wrapper(loop)
-        self.get_current_position(sid, callback=callback)
-        return f
-
-    def get_voltage(self, sid, callback=None):
-        """電圧取得 (単位: V)
-
-        :param sid:
-        :param callback:
-        :return:
-        """
-
-        # サーボIDのチェック
-        self.__check_sid(sid)
-
-        def response_process(response_data):
-            if response_data is not None and len(response_data) == 2:
-                voltage = int.from_bytes(response_data, 'little', signed=True)
-                voltage /= 100
-                return voltage
-            else:
-                raise InvalidResponseDataException('サーボからのレスポンスデータが不正です')
-
-        return self.__get_function(self.ADDR_VOLTAGE_L, self.FLAG30_MEM_MAP_SELECT, 2, response_process,
-                                   sid=sid, callback=callback)
-
-    def get_voltage_async(self, sid, loop=None):
-        """電圧取得 async版 (単位: V)
-
-        :param sid:
-        :param loop:
-        :return:
-        """
-
-        f, callback = self.__async_wrapper(loop)
-        self.get_voltage(sid, callback=callback)
-        return f
-
-    def get_target_time(self, sid, callback=None):
-        """目標位置までのサーボ移動時間を取得 (単位: 秒)
-
-        :param sid:
-        :param callback:
-        :return:
-        """
-
-        # サーボIDのチェック
-        self.__check_sid(sid)
-
-        def response_process(response_data):
-            if response_data is not None and len(response_data) == 2:
-                # 単位は 10ms 単位になっているので、秒に変更
-                speed = int.from_bytes(response_data, 'little', signed=False)
-                speed /= 100
-                return speed
-            else:
-                raise InvalidResponseDataException('サーボからのレスポンスデータが不正です')
-
-        return self.__get_function(self.ADDR_GOAL_TIME_L, self.FLAG30_MEM_MAP_SELECT, 2, response_process,
-                                   sid=sid, callback=callback)
-
-    def get_target_time_async(self, sid, loop=None):
-        """目標位置までのサーボ移動時間を取得 async版 (単位: 秒)
-
-        :param sid:
-        :param loop:
-        :return:
-        """
-
-        f, callback = self.__async_wrapper(loop)
-        self.get_speed(sid, callback=callback)
-        return f
+    get_target_time_async = async_method(get_target_time)
 
     def set_target_time(self, speed_second, sid=1):
         """目標位置までのサーボ移動時間を設定 (単位: 秒)
@@ -625,57 +647,24 @@ class Futaba(Driver):
         """
 
         # サーボIDのチェック
-        self.__check_sid(sid)
+        self._check_sid(sid)
 
         # 設定範囲は 0 から 3FFFH。つまり0秒から163830ms=163.83seconds
-        if speed_second < 0:
-            speed_second = 0
-        elif speed_second > 163.83:
-            speed_second = 163.83
+        speed_second = max(0, min(163.83, speed_second))
 
         # 10ms 単位で設定。この関数のパラメータは秒指定なので*100する
-        speed_hex = format(int(speed_second * 100) & 0xffff, '04x')
-        speed_hex_h = int(speed_hex[0:2], 16)
-        speed_hex_l = int(speed_hex[2:4], 16)
+        speed_data = _pack_u16(int(speed_second * 100) & 0xffff)
 
         # コマンド生成
-        command = self.__generate_command(sid, self.ADDR_GOAL_TIME_L, [speed_hex_l, speed_hex_h])
+        command = self.__generate_command(sid, self.ADDR_GOAL_TIME_L, speed_data)
 
         # データ送信バッファに追加
-        self.add_command(command)
-
-    def get_pid_coefficient(self, sid, callback=None):
-        """モータの制御係数を取得 (単位: %)
-
-        :param sid:
-        :param callback:
-        :return:
-        """
-
-        # サーボIDのチェック
-        self.__check_sid(sid)
+        self.command_handler.add_command(command)
 
-        def response_process(response_data):
-            if response_data is not None and len(response_data) == 1:
-                coef = response_data[0]
-                return coef
-            else:
-                raise InvalidResponseDataException('サーボからのレスポンスデータが不正です')
-
-        return self.__get_function(self.ADDR_PID_COEFFICIENT, self.FLAG30_MEM_MAP_SELECT, 1, response_process,
-                                   sid=sid, callback=callback)
+    get_pid_coefficient = _memory_map_getter('get_pid_coefficient', ADDR_PID_COEFFICIENT, FLAG30_MEM_MAP_SELECT, 1,
+                                             _parse_uint8, 'モータの制御係数を取得 (単位: %)')
 
-    def get_pid_coefficient_async(self, sid, loop=None):
-        """モータの制御係数を取得 async版 (単位: %)
-
-        :param sid:
-        :param loop:
-        :return:
-        """
-
-        f, callback = self.__async_wrapper(loop)
-        self.get_pid_coefficient(sid, callback=callback)
-        return f
+    get_pid_coefficient_async = async_method(get_pid_coefficient)
 
     def set_pid_coefficient(self, coef_percent, sid):
         """モータの制御係数を設定 (単位: %)
@@ -686,7 +675,7 @@ class Futaba(Driver):
         """
 
         # サーボIDのチェック
-        self.__check_sid(sid)
+        self._check_sid(sid)
 
         # 100%のとき設定値は、64H となります。設定範囲は 01H~FFH までです。
         if coef_percent < 1:
@@ -700,43 +689,15 @@ class Futaba(Driver):
         coef_hex = int(coef_percent)
 
         # コマンド生成
-        command = self.__generate_command(sid, self.ADDR_PID_COEFFICIENT, [coef_hex])
+        command = self.__generate_command(sid, self.ADDR_PID_COEFFICIENT, bytes((coef_hex,)))
 
         # データ送信バッファに追加
-        self.add_command(command)
-
-    def get_max_torque(self, sid, callback=None):
-        """最大トルク取得 (%)
-
-        :param sid:
-        :param callback:
-        :return:
-        """
-
-        # サーボIDのチェック
-        self.__check_sid(sid)
-
-        def response_process(response_data):
-            if response_data is not None and len(response_data) == 1:
-                max_torque = response_data[0]
-                return max_torque
-            else:
-                raise InvalidResponseDataException('サーボからのレスポンスデータが不正です')
+        self.command_handler.add_command(command)
 
-        return self.__get_function(self.ADDR_MAX_TORQUE, self.FLAG30_MEM_MAP_SELECT, 1, response_process,
-                                   sid=sid, callback=callback)
-
-    def get_max_torque_async(self, sid, loop=None):
-        """最大トルク取得 async版 (%)
-
-        :param sid:
-        :param loop:
-        :return:
-        """
+    get_max_torque = _memory_map_getter('get_max_torque', ADDR_MAX_TORQUE, FLAG30_MEM_MAP_SELECT, 1, _parse_uint8,
+                                        '最大トルク取得 (%)')
 
-        f, callback = self.__async_wrapper(loop)
-        self.get_max_torque(sid, callback=callback)
-        return f
+    get_max_torque_async = async_method(get_max_torque)
 
     def set_max_torque(self, torque_percent, sid):
         """最大トルク設定 (%)
@@ -747,91 +708,31 @@ class Futaba(Driver):
         """
 
         # サーボIDのチェック
-        self.__check_sid(sid)
+        self._check_sid(sid)
 
         # 0-100%で設定
-        if torque_percent < 0:
-            torque_percent = 0
-        elif torque_percent > 100:
-            torque_percent = 100
+        torque_percent = max(0, min(100, torque_percent))
 
         torque_hex = int(torque_percent)
 
         # コマンド生成
-        command = self.__generate_command(sid, self.ADDR_MAX_TORQUE, [torque_hex])
+        command = self.__generate_command(sid, self.ADDR_MAX_TORQUE, bytes((torque_hex,)))
 
         # データ送信バッファに追加
-        self.add_command(command)
-
-    def get_speed(self, sid, callback=None):
-        """現在の回転速度を取得 (deg/s)
-
-        :param sid:
-        :param callback:
-        :return:
-        """
-
-        # サーボIDのチェック
-        self.__check_sid(sid)
-
-        def response_process(response_data):
-            if response_data is not None and len(response_data) == 2:
-                speed = int.from_bytes(response_data, 'little', signed=True)
-                return speed
-            else:
-                raise InvalidResponseDataException('サーボからのレスポンスデータが不正です')
-
-        return self.__get_function(self.ADDR_PRESENT_SPEED_L, self.FLAG30_MEM_MAP_SELECT, 2, response_process,
-                                   sid=sid, callback=callback)
-
-    def get_speed_async(self, sid, loop=None):
-        """現在の回転速度を取得 async版 (deg/s)
+        self.command_handler.add_command(command)
 
-        :param sid:
-        :param loop:
-        :return:
-        """
+    get_speed = _memory_map_getter('get_speed', ADDR_PRESENT_SPEED_L, FLAG30_MEM_MAP_SELECT, 2, _parse_int16,
+                                   '現在の回転速度を取得 (deg/s)')
 
-        f, callback = self.__async_wrapper(loop)
-        self.get_speed(sid, callback=callback)
-        return f
+    get_speed_async = async_method(get_speed)
 
     def set_speed(self, dps, sid):
         """Futabaでは未サポート"""
         raise NotSupportException('Futabaではset_speedに対応していません。set_target_time()で回転スピードを制御してください。')
 
-    def get_servo_id(self, sid, callback=None):
-        """サーボIDを取得
-
-        :param sid:
-        :param callback:
-        :return:
-        """
-
-        # サーボIDのチェック
-        self.__check_sid(sid)
-
-        def response_process(response_data):
-            if response_data is not None and len(response_data) == 1:
-                servo_id = int.from_bytes(response_data, 'little', signed=False)
-                return servo_id
-            else:
-                raise InvalidResponseDataException('サーボからのレスポンスデータが不正です')
-
-        return self.__get_function(self.ADDR_SERVO_ID, self.FLAG30_MEM_MAP_SELECT, 1, response_process,
-                                   sid=sid, callback=callback)
+    get_servo_id = _memory_map_getter('get_servo_id', ADDR_SERVO_ID, FLAG30_MEM_MAP_SELECT, 1, _parse_uint8, 'サーボIDを取得')
 
-    def get_servo_id_async(self, sid, loop=None):
-        """サーボIDを取得 async版
-
-        :param sid:
-        :param loop:
-        :return:
-        """
-
-        f, callback = self.__async_wrapper(loop)
-        self.get_servo_id(sid, callback=callback)
-        return f
+    get_servo_id_async = async_method(get_servo_id)
 
     def set_servo_id(self, new_sid, sid):
         """サーボIDを設定
@@ -842,22 +743,19 @@ class Futaba(Driver):
         """
 
         # サーボIDのチェック
-        self.__check_sid(new_sid)
-        self.__check_sid(sid)
+        self._check_sid(new_sid)
+        self._check_sid(sid)
 
         # 0-100%で設定
-        if new_sid < 1:
-            new_sid = 1
-        elif new_sid > 127:
-            new_sid = 127
+        new_sid = max(1, min(127, new_sid))
 
         new_sid_hex = int(new_sid)
 
         # コマンド生成
-        command = self.__generate_command(sid, self.ADDR_SERVO_ID, [new_sid_hex])
+        command = self.__generate_command(sid, self.ADDR_SERVO_ID, bytes((new_sid_hex,)))
 
         # データ送信バッファに追加
-        self.add_command(command)
+        self.command_handler.add_command(command)
 
     def save_rom(self, sid):
         """フラッシュROMに書き込む
@@ -867,46 +765,18 @@ class Futaba(Driver):
         """
 
         # サーボIDのチェック
-        self.__check_sid(sid)
+        self._check_sid(sid)
 
         # コマンド生成
         command = self.__generate_command(sid, self.ADDR_WRITE_FLASH_ROM, flag=0x40, count=0)
 
         # データ送信バッファに追加
-        self.add_command(command)
-
-    def get_baud_rate(self, sid, callback=None):
-        """通信速度を取得
-
-        :param sid:
-        :param callback:
-        :return:
-        """
-
-        # サーボIDのチェック
-        self.__check_sid(sid)
-
-        def response_process(response_data):
-            if response_data is not None and len(response_data) == 1:
-                baud_rate = int.from_bytes(response_data, 'little', signed=False)
-                return baud_rate
-            else:
-                raise InvalidResponseDataException('サーボからのレスポンスデータが不正です')
+        self.command_handler.add_command(command)
 
-        return self.__get_function(self.ADDR_BAUD_RATE, self.FLAG30_MEM_MAP_SELECT, 1, response_process,
-                                   sid=sid, callback=callback)
-
-    def get_baud_rate_async(self, sid, loop=None):
-        """通信速度を取得 async版
-
-        :param sid:
-        :param loop:
-        :return:
-        """
+    get_baud_rate = _memory_map_getter('get_baud_rate', ADDR_BAUD_RATE, FLAG30_MEM_MAP_SELECT, 1, _parse_uint8,
+                                       '通信速度を取得')
 
-        f, callback = self.__async_wrapper(loop)
-        self.get_baud_rate(sid, callback=callback)
-        return f
+    get_baud_rate_async = async_method(get_baud_rate)
 
     def set_baud_rate(self, baud_rate_id, sid):
         """通信速度を設定
@@ -917,53 +787,24 @@ class Futaba(Driver):
         """
 
         # サーボIDのチェック
-        self.__check_sid(sid)
+        self._check_sid(sid)
 
         # 通信速度IDのチェック
-        if self.BAUD_RATE_INDEX_9600 < baud_rate_id > self.BAUD_RATE_INDEX_230400:
+        if baud_rate_id not in self._VALID_BAUD_RATE_IDS:
             raise BadInputParametersException('baud_rate_id が不正な値です')
 
         baud_rate_id_hex = int(baud_rate_id)
 
         # コマンド生成
-        command = self.__generate_command(sid, self.ADDR_BAUD_RATE, [baud_rate_id_hex])
+        command = self.__generate_command(sid, self.ADDR_BAUD_RATE, bytes((baud_rate_id_hex,)))
 
         # データ送信バッファに追加
-        self.add_command(command)
-
-    def get_limit_cw_position(self, sid, callback=None):
-        """右(時計回り)リミット角度の取得
-
-        :param sid:
-        :param callback:
-        :return:
-        """
-
-        # サーボIDのチェック
-        self.__check_sid(sid)
-
-        def response_process(response_data):
-            if response_data is not None and len(response_data) == 2:
-                limit_position = int.from_bytes(response_data, 'little', signed=True)
-                limit_position /= 10
-                return limit_position
-            else:
-                raise InvalidResponseDataException('サーボからのレスポンスデータが不正です')
-
-        return self.__get_function(self.ADDR_CW_ANGLE_LIMIT_L, self.FLAG30_MEM_MAP_SELECT, 2, response_process,
-                                   sid=sid, callback=callback)
-
-    def get_limit_cw_position_async(self, sid, loop=None):
-        """右(時計回り)リミット角度の取得 async版
+        self.command_handler.add_command(command)
 
-        :param sid:
-        :param loop:
-        :return:
-        """
+    get_limit_cw_position = _memory_map_getter('get_limit_cw_position', ADDR_CW_ANGLE_LIMIT_L, FLAG30_MEM_MAP_SELECT, 2,
+                                               _parse_int16_div10, '右(時計回り)リミット角度の取得')
 
-        f, callback = self.__async_wrapper(loop)
-        self.get_limit_cw_position(sid, callback=callback)
-        return f
+    get_limit_cw_position_async = async_method(get_limit_cw_position)
 
     def set_limit_cw_position(self, limit_position, sid):
         """右(時計回り)リミット角度を設定
@@ -974,55 +815,24 @@ class Futaba(Driver):
         """
 
         # サーボIDのチェック
-        self.__check_sid(sid)
+        self._check_sid(sid)
 
         # リミット角度のチェック
-        if 0 < limit_position > 150:
+        if not 0 <= limit_position <= 150:
             raise BadInputParametersException('limit_position が不正な値です。0〜+150を設定してください。')
 
-        limit_position_hex = format(int(limit_position * 10) & 0xffff, '04x')
-        limit_position_hex_h = int(limit_position_hex[0:2], 16)
-        limit_position_hex_l = int(limit_position_hex[2:4], 16)
+        limit_position_data = _pack_u16(int(limit_position * 10) & 0xffff)
 
         # コマンド生成
-        command = self.__generate_command(sid, self.ADDR_CW_ANGLE_LIMIT_L, [limit_position_hex_l, limit_position_hex_h])
+        command = self.__generate_command(sid, self.ADDR_CW_ANGLE_LIMIT_L, limit_position_data)
 
         # データ送信バッファに追加
-        self.add_command(command)
-
-    def get_limit_ccw_position(self, sid, callback=None):
-        """左(反時計回り)リミット角度の取得
-
-        :param sid:
-        :param callback:
-        :return:
-        """
-
-        # サーボIDのチェック
-        self.__check_sid(sid)
-
-        def response_process(response_data):
-            if response_data is not None and len(response_data) == 2:
-                limit_position = int.from_bytes(response_data, 'little', signed=True)
-                limit_position /= 10
-                return limit_position
-            else:
-                raise InvalidResponseDataException('サーボからのレスポンスデータが不正です')
-
-        return self.__get_function(self.ADDR_CCW_ANGLE_LIMIT_L, self.FLAG30_MEM_MAP_SELECT, 2, response_process,
-                                   sid=sid, callback=callback)
+        self.command_handler.add_command(command)
 
-    def get_limit_ccw_position_async(self, sid, loop=None):
-        """左(反時計回り)リミット角度の取得 async版
+    get_limit_ccw_position = _memory_map_getter('get_limit_ccw_position', ADDR_CCW_ANGLE_LIMIT_L, FLAG30_MEM_MAP_SELECT,
+                                                2, _parse_int16_div10, '左(反時計回り)リミット角度の取得')
 
-        :param sid:
-        :param loop:
-        :return:
-        """
-
-        f, callback = self.__async_wrapper(loop)
-        self.get_limit_ccw_position(sid, callback=callback)
-        return f
+    get_limit_ccw_position_async = async_method(get_limit_ccw_position)
 
     def set_limit_ccw_position(self, limit_position, sid):
         """左(反時計回り)リミット角度を設定
@@ -1033,55 +843,24 @@ class Futaba(Driver):
         """
 
         # サーボIDのチェック
-        self.__check_sid(sid)
+        self._check_sid(sid)
 
         # リミット角度のチェック
-        if -150 < limit_position > 0:
+        if not -150 <= limit_position <= 0:
             raise BadInputParametersException('limit_position が不正な値です。-150〜0を設定してください。')
 
-        limit_position_hex = format(int(limit_position * 10 & 0xffff), '04x')
-        limit_position_hex_h = int(limit_position_hex[0:2], 16)
-        limit_position_hex_l = int(limit_position_hex[2:4], 16)
+        limit_position_data = _pack_u16(int(limit_position * 10) & 0xffff)
 
         # コマンド生成
-        command = self.__generate_command(sid, self.ADDR_CCW_ANGLE_LIMIT_L,
-                                          [limit_position_hex_l, limit_position_hex_h])
+        command = self.__generate_command(sid, self.ADDR_CCW_ANGLE_LIMIT_L, limit_position_data)
 
         # データ送信バッファに追加
-        self.add_command(command)
-
-    def get_limit_temperature(self, sid, callback=None):
-        """温度リミットの取得 (℃)
-
-        :param sid:
-        :param callback:
-        :return:
-        """
-
-        # サーボIDのチェック
-        self.__check_sid(sid)
-
-        def response_process(response_data):
-            if response_data is not None and len(response_data) == 2:
-                limit_temp = int.from_bytes(response_data, 'little', signed=True)
-                return limit_temp
-            else:
-                raise InvalidResponseDataException('サーボからのレスポンスデータが不正です')
+        self.command_handler.add_command(command)
 
-        return self.__get_function(self.ADDR_TEMPERATURE_LIMIT_L, self.FLAG30_MEM_MAP_SELECT, 2, response_process,
-                                   sid=sid, callback=callback)
-
-    def get_limit_temperature_async(self, sid, loop=None):
-        """温度リミットの取得 (℃) async版
-
-        :param sid:
-        :param loop:
-        :return:
-        """
+    get_limit_temperature = _memory_map_getter('get_limit_temperature', ADDR_TEMPERATURE_LIMIT_L, FLAG30_MEM_MAP_SELECT,
+                                               2, _parse_int16, '温度リミットの取得 (℃)')
 
-        f, callback = self.__async_wrapper(loop)
-        self.get_limit_temperature(sid, callback=callback)
-        return f
+    get_limit_temperature_async = async_method(get_limit_temperature)
 
     def set_limit_temperature(self, limit_temp, sid):
         """Futabaでは未サポート"""
@@ -1094,29 +873,28 @@ class Futaba(Driver):
         :return:
         """
 
+        # サーボ数が多い場合はNumPyでまとめて変換
+        if np is not None and len(sid_target_positions) >= NUMPY_BURST_THRESHOLD:
+            command = self.__generate_burst_positions_command_numpy(sid_target_positions)
+            self.command_handler.add_command(command)
+            return
+
+        # サーボIDのチェック
+        self.__check_sids(sid_target_positions)
+
         # データチェック & コマンドデータ生成
         vid_data = {}
         for sid, position_degree in sid_target_positions.items():
-            # サーボIDのチェック
-            self.__check_sid(sid)
-
             # 設定可能な範囲は-150.0 度~+150.0 度
-            if position_degree < -150:
-                position_degree = -150
-            elif position_degree > 150:
-                position_degree = 150
-
-            position_hex = format(int(position_degree * 10) & 0xffff, '04x')
-            position_hex_h = int(position_hex[0:2], 16)
-            position_hex_l = int(position_hex[2:4], 16)
+            position_degree = max(-150, min(150, position_degree))
 
-            vid_data[sid] = [position_hex_l, position_hex_h]
+            vid_data[sid] = _pack_u16(int(position_degree * 10) & 0xffff)
 
         # コマンド生成
         command = self.__generate_burst_command(self.ADDR_GOAL_POSITION_L, 3, vid_data)
 
         # データ送信バッファに追加
-        self.add_command(command)
+        self.command_handler.add_command(command)
 
     def get_burst_positions(self, sids, callback=None):
         """複数のサーボの現在のポジションを一気にリード
@@ -1125,7 +903,6 @@ class Futaba(Driver):
         :param callback:
         :return:
         """
-        """Futabaでは未サポート"""
         raise NotSupportException('Futabaではget_burst_positionsに対応していません。')
 
     def get_burst_positions_async(self, sids, loop=None):
@@ -1135,7 +912,6 @@ class Futaba(Driver):
         :param loop:
         :return:
         """
-        """Futabaでは未サポート"""
         raise NotSupportException('Futabaではget_burst_positions_asyncに対応していません。')
 
     def reset_memory(self, sid):
@@ -1146,13 +922,13 @@ class Futaba(Driver):
         """
 
         # サーボIDのチェック
-        self.__check_sid(sid)
+        self._check_sid(sid)
 
         # コマンド生成
         command = self.__generate_command(sid, self.ADDR_RESET_MEMORY, flag=self.FLAG4_RESET_MEMORY_MAP, count=0)
 
         # データ送信バッファに追加
-        self.add_command(command)
+        self.command_handler.add_command(command)
 
     def read(self, sid, address, length, callback=None):
         """データを読み込む
@@ -1165,30 +941,11 @@ class Futaba(Driver):
         """
 
         # サーボIDのチェック
-        self.__check_sid(sid)
-
-        def response_process(response_data):
-            if response_data is not None and len(response_data) == length:
-                return response_data
-            else:
-                raise InvalidResponseDataException('サーボからのレスポンスデータが不正です')
+        self._check_sid(sid)
 
-        return self.__get_function(address, self.FLAG30_MEM_MAP_SELECT, length, response_process,
-                                   sid=sid, callback=callback)
-
-    def read_async(self, sid, address, length, loop=None):
-        """データを読み込む async版
-
-        :param sid:
-        :param address:
-        :param length:
-        :param loop:
-        :return:
-        """
+        return self._get_function(address, self.FLAG30_MEM_MAP_SELECT, length, bytes, sid=sid, callback=callback)
 
-        f, callback = self.__async_wrapper(loop)
-        self.read(sid, address, length, callback=callback)
-        return f
+    read_async = async_method(read)
 
     def write(self, sid, address, data):
         """データを書き込む
@@ -1200,13 +957,13 @@ class Futaba(Driver):
         """
 
         # サーボIDのチェック
-        self.__check_sid(sid)
+        self._check_sid(sid)
 
         # コマンド生成
         command = self.__generate_command(sid, address, data)
 
         # データ送信バッファに追加
-        self.add_command(command)
+        self.command_handler.add_command(command)
 
     def burst_read(self, sid_address_length, callback=None):
         """複数サーボから一括でデータ読み取り
@@ -1215,7 +972,6 @@ class Futaba(Driver):
         :param callback:
         :return:
         """
-        """Futabaでは未サポート"""
         raise NotSupportException('Futabaではburst_readに対応していません。')
 
     def burst_read_async(self, sid_address_length, loop=None):
@@ -1225,28 +981,28 @@ class Futaba(Driver):
         :param loop:
         :return:
         """
-        """Futabaでは未サポート"""
         raise NotSupportException('Futabaではburst_read_asyncに対応していません。')
 
     def burst_write(self, address, length, sid_data):
         """複数サーボに一括で書き込み
 
-        :param address:
-        :param length:
-        :param sid_data:
+        :param address: 書き込み先アドレス
+        :param length: サーボ1つ分のデータ長 (VIDは含まない)
+        :param sid_data: {サーボID: データ(lengthバイト)}
         :return:
         """
 
-        # データチェック & コマンドデータ生成
-        vid_data = {}
-        for sid, data in sid_data.items():
-            # サーボIDのチェック
-            self.__check_sid(sid)
+        # サーボIDのチェック
+        self.__check_sids(sid_data)
 
-            vid_data[sid] = data
+        # データチェック
+        for sid, data in sid_data.items():
+            if len(data) != length:
+                raise BadInputParametersException('sid: %d のデータ長が不正です。%dバイトのデータを設定してください。'
+                                                  % (sid, length))
 
-        # コマンド生成
-        command = self.__generate_burst_command(address, length, vid_data)
+        # コマンド生成 (パケットのLengthはVID(1) + Dataのバイト数)
+        command = self.__generate_burst_command(address, length + 1, sid_data)
 
         # データ送信バッファに追加
-        self.add_command(command)
+        self.command_handler.add_command(command)
@@ -29,10 +29,38 @@ class ICommandHandler(metaclass=ABCMeta):
     # クローズ強制フラグ
     close_force = False
 
+    # 遅延送信中のコマンドバッファ (スレッドごと)
+    tx_local = None
+
+    # 受信途中のレスポンスデータから受信完了に必要なバイト数を取得する関数
+    function_get_response_length = None
+
     @abstractmethod
-    def add_command(self, data, recv_callback=None):
+    def add_command(self, data, recv_callback=None, response_count=1):
         raise NotImplementedError()
 
     @abstractmethod
     def close(self, force=False):
         raise NotImplementedError()
+
+    def begin_batch(self):
+        """レスポンスなしのコマンドの遅延送信を開始する
+        未対応のコマンドハンドラーでは何もしない
+
+        :return: 遅延送信を新たに開始したか
+        """
+        return False
+
+    def flush(self):
+        """遅延送信中のコマンドをまとめて送信する
+        未対応のコマンドハンドラーでは何もしない
+
+        :return:
+        """
+
+    def end_batch(self):
+        """遅延送信中のコマンドを送信し、遅延送信を終了する
+        未対応のコマンドハンドラーでは何もしない
+
+        :return:
+        """
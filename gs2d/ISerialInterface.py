@@ -10,9 +10,22 @@ class ISerialInterface(metaclass=ABCMeta):
         raise NotImplementedError()
 
     @abstractmethod
-    def read(self):
+    def read(self, size=1):
         raise NotImplementedError()
 
+    def read_into(self, buffer):
+        """受信データをbufferに書き込む
+        デフォルトではread()で受信したデータをコピーする
+
+        :param buffer: 書き込み先のbytearray/memoryview
+        :return: 受信したバイト数
+        """
+
+        data = self.read()
+        size = len(data)
+        buffer[:size] = data
+        return size
+
     @abstractmethod
     def is_open(self):
         raise NotImplementedError()
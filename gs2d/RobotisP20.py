@@ -1,14 +1,21 @@
 # ! /usr/bin/env python3
 # encoding: utf-8
 
-import time
 import logging
+import threading
+from functools import lru_cache
+
+try:
+    import struct
+except:
+    # For MicroPython
+    import ustruct as struct
 
 from .ICommandHandler import ICommandHandler
 from .ISerialInterface import ISerialInterface
-from .Driver import Driver
+from .Driver import Driver, async_method
 from .Util import ReceiveDataTimeoutException, NotSupportException, BadInputParametersException, WrongCheckSumException
-from .Util import InvalidResponseDataException
+from .Util import InvalidResponseDataException, StatusErrorException
 from .Util import get_printable_hex
 
 # ロガー
@@ -16,12 +23,357 @@ logger = logging.getLogger(__name__)
 
 RECEIVE_DATA_TIMEOUT_SEC = 19
 
+# 制御ループで頻繁に使うアドレス (クラス属性の参照を避けるためモジュール定数として保持)
+_ADDR_TORQUE_ENABLE = 64
+_ADDR_GOAL_POSITION = 116
+_ADDR_PRESENT_POSITION = 132
+_ADDR_PRESENT_TEMPERATURE = 146
+
+# 位置の変換係数 (0~360度 <-> 0~4096)
+_DEG_TO_RAW = 4096.0 / 360.0
+_RAW_TO_DEG = 360.0 / 4096.0
+
+# little-endianデータとの変換
+_pack_u16 = struct.Struct('<H').pack
+_pack_into_u16 = struct.Struct('<H').pack_into
+_unpack_s8 = struct.Struct('<b').unpack
+_unpack_from_u16 = struct.Struct('<H').unpack_from
+_unpack_s32 = struct.Struct('<i').unpack
+
+# Numbaで計算するCRCの最小データ長(bytes) (短いデータは呼び出しのオーバーヘッドの方が大きい)
+NUMBA_CRC_THRESHOLD = 16
+
+# NumPy, Numba (読み込みに時間がかかるため、ドライバーの初期化時に_load_accelerators()で読み込む)
+np = None
+_CRC_TABLE_ARRAY = None
+_crc16_kernel = None
+_encode_sync_write_positions = None
+_accelerators_loaded = False
+
+# バイトスタッフィング (パラメータ中のHeader部と一致するデータ列のうしろに0xFDを追加する)
+_HEADER_PATTERN = b'\xff\xff\xfd'
+_STUFFED_HEADER_PATTERN = b'\xff\xff\xfd\xfd'
+
+# NumPyでまとめて変換するSync Readのサーボ数の下限
+NUMPY_SYNC_READ_THRESHOLD = 8
+
+# NumPyでまとめて変換するSync Writeのサーボ数の下限
+NUMPY_SYNC_WRITE_THRESHOLD = 8
+
+# 有効なServo ID (0~252(0x00~0xFC)及び254(0xFE))
+_VALID_SIDS = frozenset(range(0, 253)) | frozenset([254])
+
+
+def _generate_crc_table():
+    """CRC-16-IBM (X^16+X^15+X^2+1 Polynomial 0x8005) のテーブルを生成
+
+    :return:
+    """
+
+    table = []
+    for i in range(256):
+        crc = i << 8
+        for _ in range(8):
+            crc = ((crc << 1) ^ 0x8005) if crc & 0x8000 else (crc << 1)
+        table.append(crc & 0xFFFF)
+    return tuple(table)
+
+
+# CRC-16-IBMのテーブル
+_CRC_TABLE = _generate_crc_table()
+
+# 2bytes(16bit)ずつCRCを計算するための上位バイト用テーブル (上位バイトの後に0x00が続く場合のCRC)
+_CRC_TABLE_HIGH = tuple(((crc << 8) & 0xFFFF) ^ _CRC_TABLE[crc >> 8] for crc in _CRC_TABLE)
+
+
+def _crc16(data, crc=0):
+    """CRC-16-IBMを計算
+    crcに途中までのCRCを渡すと、その続きから計算する
+
+    :param data: bytes, bytearray, memoryview, intのlistなど
+    :param crc: 途中までのCRC
+    :return:
+    """
+
+    # list等のbuffer protocolに対応していないデータは、どの計算方法でも扱えるようにbytesにする
+    if not isinstance(data, (bytes, bytearray, memoryview)):
+        data = bytes(data)
+
+    if _crc16_kernel is not None and len(data) >= NUMBA_CRC_THRESHOLD:
+        return int(_crc16_kernel(np.frombuffer(data, dtype=np.uint8), _CRC_TABLE_ARRAY, crc))
+
+    table = _CRC_TABLE
+    size = len(data)
+    if size >= 8:
+        # 2bytes(big-endian)ずつまとめて計算し、ループ回数を半分にする
+        table_high = _CRC_TABLE_HIGH
+        for word in struct.unpack_from('>%dH' % (size >> 1), data):
+            word ^= crc
+            crc = table_high[word >> 8] ^ table[word & 0xFF]
+
+        # 奇数バイトの場合は最後の1byteを計算
+        if size & 1:
+            crc = ((crc << 8) & 0xFFFF) ^ table[(crc >> 8) ^ data[size - 1]]
+        return crc
+
+    for d in data:
+        crc = ((crc << 8) & 0xFFFF) ^ table[(crc >> 8) ^ d]
+    return crc
+
+
+def _crc16_table_loop(data, table, crc):
+    """CRC-16-IBMを計算 (Numbaでコンパイルする関数の元)
+
+    :param data: uint8配列
+    :param table: CRC-16-IBMのテーブル
+    :param crc: 途中までのCRC
+    :return:
+    """
+
+    for d in data:
+        crc = ((crc << 8) & 0xFFFF) ^ table[(crc >> 8) ^ d]
+    return crc
+
+
+def _encode_sync_write_positions_loop(sids, positions, out):
+    """Sync Writeでのポジション設定のID+Data部を生成 (Numbaでコンパイルする関数の元)
+
+    :param sids: サーボID (int64配列)
+    :param positions: 位置(度) (float64配列)
+    :param out: 書き込み先 (uint8配列, サーボ数*5bytes)
+    :return:
+    """
+
+    for i in range(sids.size):
+        # 位置 (-180から180まで)。Dynamixelでは0〜360°なので変換
+        position = int(np.rint((min(max(positions[i], -180.0), 180.0) + 180.0) * _DEG_TO_RAW))
+
+        offset = i * 5
+        out[offset] = sids[i]
+        out[offset + 1] = position & 0xFF
+        out[offset + 2] = (position >> 8) & 0xFF
+        out[offset + 3] = (position >> 16) & 0xFF
+        out[offset + 4] = (position >> 24) & 0xFF
+
+
+def _load_accelerators():
+    """NumPy, Numbaを読み込み、Numbaの関数をコンパイル(キャッシュから読み込み)しておく
+    import時間を増やさないようにドライバーの初期化時に呼び出し、制御ループ中の最初の呼び出しでコンパイルしないようにする
+
+    :return:
+    """
+
+    global np, _CRC_TABLE_ARRAY, _crc16_kernel, _encode_sync_write_positions, _accelerators_loaded
+
+    if _accelerators_loaded:
+        return
+    _accelerators_loaded = True
+
+    try:
+        import numpy
+    except ImportError:
+        # NumPyがない環境では通常の処理を使う
+        return
+    np = numpy
+
+    try:
+        from numba import njit
+    except ImportError:
+        # Numbaがない環境では通常の処理を使う
+        return
+
+    # CRC-16-IBMのテーブル (Numba用)
+    table = np.array(_CRC_TABLE, dtype=np.uint16)
+    crc16_kernel = njit(cache=True)(_crc16_table_loop)
+    encode_sync_write_positions = njit(cache=True)(_encode_sync_write_positions_loop)
+
+    # 送信コマンド(書き込み可能)と受信データ(読み込み専用)の両方の型でコンパイルしておく
+    crc16_kernel(np.zeros(NUMBA_CRC_THRESHOLD, dtype=np.uint8), table, 0)
+    crc16_kernel(np.frombuffer(bytes(NUMBA_CRC_THRESHOLD), dtype=np.uint8), table, 0)
+    encode_sync_write_positions(np.zeros(1, dtype=np.int64), np.zeros(1, dtype=np.float64),
+                                np.zeros(5, dtype=np.uint8))
+
+    _CRC_TABLE_ARRAY = table
+    _crc16_kernel = crc16_kernel
+    _encode_sync_write_positions = encode_sync_write_positions
+
+
+@lru_cache(maxsize=64)
+def _sync_write_header(address, length, count):
+    """Sync Writeのヘッダー部を生成 (同じアドレス, データ長, サーボ数ならキャッシュを返す)
+
+    :param address: 書き込み先アドレス
+    :param length: サーボ1つ分のデータ長
+    :param count: サーボの数
+    :return:
+    """
+
+    # Header:      0xFF,0xFF,0xFD,0x00
+    # ID:          ブロードキャストID(0xFE)
+    # Length:      Instruction(1) + Address(2) + Data length(2) + (ID(1) + Data) * count + Checksum(2)
+    # Instruction: SYNC_WRITE(0x83)
+    # Parameter:   Address(2), Data length(2), ID(1) + Data, ...
+    return struct.pack('<4BBHBHH', 0xFF, 0xFF, 0xFD, 0x00, 0xFE, 5 + count * (1 + length) + 2, 0x83, address, length)
+
+
+@lru_cache(maxsize=512)
+def _read_command(sid, address, length):
+    """READコマンドを生成 (同じID, アドレス, データ長ならキャッシュを返す)
+
+    :param sid: サーボID
+    :param address: 読み込み先アドレス
+    :param length: データ長
+    :return:
+    """
+
+    # Header:      0xFF,0xFF,0xFD,0x00
+    # ID:          サーボID
+    # Length:      Instruction(1) + Address(2) + Data length(2) + Checksum(2) = 7
+    # Instruction: READ(0x02)
+    # Parameter:   Address(2), Data length(2)
+    command = struct.pack('<4BBHBHH', 0xFF, 0xFF, 0xFD, 0x00, sid, 7, 0x02, address, length)
+
+    # Checksum
+    crc = _crc16(command)
+    return command + bytes((crc & 0xFF, crc >> 8))
+
+
+@lru_cache(maxsize=64)
+def _sync_read_command(address, length, sids):
+    """Sync Readコマンドを生成 (同じアドレス, データ長, サーボIDの組み合わせならキャッシュを返す)
+
+    :param address: 読み込み先アドレス
+    :param length: サーボ1つ分のデータ長
+    :param sids: サーボIDのタプル
+    :return:
+    """
+
+    # Parameter: Address(2), Data length(2), ID(1) * サーボの数
+    # Header部と一致するデータ列のうしろに0xFDを追加
+    params = struct.pack('<HH', address, length) + bytes(sids)
+    params = params.replace(_HEADER_PATTERN, _STUFFED_HEADER_PATTERN)
+
+    # Header:      0xFF,0xFF,0xFD,0x00
+    # ID:          ブロードキャストID(0xFE)
+    # Length:      Instruction(1) + Parameter + Checksum(2)
+    # Instruction: SYNC_READ(0x82)
+    command = struct.pack('<4BBHB', 0xFF, 0xFF, 0xFD, 0x00, 0xFE, 1 + len(params) + 2, 0x82) + params
+
+    # Checksum
+    crc = _crc16(command)
+    return command + bytes((crc & 0xFF, crc >> 8))
+
+
+@lru_cache(maxsize=64)
+def _sync_write_header_crc(address, length, count):
+    """Sync Writeのヘッダー部までのCRCを計算 (同じアドレス, データ長, サーボ数ならキャッシュを返す)
+
+    :param address: 書き込み先アドレス
+    :param length: サーボ1つ分のデータ長
+    :param count: サーボの数
+    :return:
+    """
+
+    return _crc16(_sync_write_header(address, length, count))
+
+
+@lru_cache(maxsize=512)
+def _header_crc(sid, length, instruction):
+    """Header, ID, Length, InstructionまでのCRCを計算 (同じID, Length, Instructionならキャッシュを返す)
+
+    :param sid: サーボID
+    :param length: Length
+    :param instruction: Instruction
+    :return:
+    """
+
+    return _crc16(struct.pack('<4BBHB', 0xFF, 0xFF, 0xFD, 0x00, sid, length, instruction))
+
+
+# レスポンスデータの変換関数
+# データ長は__get_function, __sync_readでチェック済みなので、ここではチェックしない
+def _parse_ping(response_data):
+    """PINGのレスポンスデータを変換
+
+    :param response_data:
+    :return:
+    """
+
+    model_no = bytes(response_data[0:2])
+    version_firmware = response_data[2]
+    return {
+        'model_no': model_no,
+        'version_firmware': version_firmware
+    }
+
+
+def _parse_bool(response_data):
+    """1byteのON/OFFのレスポンスデータを変換
+
+    :param response_data:
+    :return:
+    """
+
+    return response_data[0] == 0x01
+
+
+def _parse_int8(response_data):
+    """1byteの符号あり整数のレスポンスデータを変換
+
+    :param response_data:
+    :return:
+    """
+
+    return _unpack_s8(response_data)[0]
+
+
+def _parse_position(response_data):
+    """4bytesの位置のレスポンスデータを度に変換
+
+    :param response_data:
+    :return:
+    """
+
+    return _unpack_s32(response_data)[0] * _RAW_TO_DEG - 180
+
+
+def _parse_positions_vectorized(recv_sids, response_data):
+    """Sync Readで受信した全サーボ分の位置データをNumPyでまとめて度に変換
+
+    :param recv_sids: 受信できたサーボIDのリスト
+    :param response_data: 受信できたサーボ分の位置データを連結したもの
+    :return:
+    """
+
+    positions = np.frombuffer(response_data, dtype='<i4') * _RAW_TO_DEG - 180
+    return dict(zip(recv_sids, positions.tolist()))
+
 
 class RobotisP20(Driver):
     """Robotis社のP2.0のプロトコルに対応したシリアルサーボクラス
 
     """
 
+    __slots__ = ()
+
+    # 対応していない操作 (未実装の操作も含む)
+    NOT_SUPPORTED_OPS = frozenset([
+        'set_speed', 'set_limit_temperature',
+        'burst_read', 'burst_read_async',
+        'get_current', 'get_current_async',
+        'get_voltage', 'get_voltage_async',
+        'get_target_time', 'get_target_time_async', 'set_target_time',
+        'get_pid_coefficient', 'get_pid_coefficient_async', 'set_pid_coefficient',
+        'get_max_torque', 'get_max_torque_async', 'set_max_torque',
+        'get_speed', 'get_speed_async',
+        'get_servo_id', 'get_servo_id_async', 'set_servo_id',
+        'save_rom', 'reset_memory',
+        'get_baud_rate', 'get_baud_rate_async', 'set_baud_rate',
+        'get_limit_cw_position', 'get_limit_cw_position_async', 'set_limit_cw_position',
+        'get_limit_ccw_position', 'get_limit_ccw_position_async', 'set_limit_ccw_position',
+        'get_limit_temperature', 'get_limit_temperature_async',
+    ])
+
     # インストラクション
     INSTRUCTION_PING = 0x01
     INSTRUCTION_READ = 0x02
@@ -63,7 +415,7 @@ class RobotisP20(Driver):
     ADDR_EXTERNAL_PORT_MODE3 = 58
     ADDR_SHUTDOWN = 63
 
-    ADDR_TORQUE_ENABLE = 64
+    ADDR_TORQUE_ENABLE = _ADDR_TORQUE_ENABLE
     ADDR_LED = 65
     ADDR_STATUS_RETURN_LEVEL = 68
     ADDR_REGISTERED_INSTRUCTION = 69
@@ -81,7 +433,7 @@ class RobotisP20(Driver):
     ADDR_GOAL_VELOCITY = 104
     ADDR_PROFILE_ACCELERATION = 108
     ADDR_PROFILE_VELOCITY = 112
-    ADDR_GOAL_POSITION = 116
+    ADDR_GOAL_POSITION = _ADDR_GOAL_POSITION
 
     ADDR_REALTIME_TICK = 120
     ADDR_MOVING = 122
@@ -89,11 +441,11 @@ class RobotisP20(Driver):
     ADDR_PRESENT_PWM = 124
     ADDR_PRESENT_CURRENT = 126
     ADDR_PRESENT_VELOCITY = 128
-    ADDR_PRESENT_POSITION = 132
+    ADDR_PRESENT_POSITION = _ADDR_PRESENT_POSITION
     ADDR_VELOCITY_TRAJECTORY = 136
     ADDR_POSITION_TRAJECTORY = 140
     ADDR_PRESENT_INPUT_VOLTAGE = 144
-    ADDR_PRESENT_TEMPERATURE = 146
+    ADDR_PRESENT_TEMPERATURE = _ADDR_PRESENT_TEMPERATURE
 
     # 通信速度のIDと実際の設定値
     BAUD_RATE_INDEX_9600 = 0x00
@@ -113,57 +465,56 @@ class RobotisP20(Driver):
 
     STATUS_PACKET_INSTRUCTION = 0x55
 
+    # ブロードキャストID
+    BROADCAST_ID = 0xFE
+
+    # Sync Writeのヘッダー長 (Header, ID, Length, Instruction, Address, Data length)
+    SYNC_WRITE_HEADER_LENGTH = 12
+
+    # 固定長コマンドのテンプレート (ID と Checksum のみ書き換えて使う)
+    # PING: Header, ID, Length(3), Instruction, Checksum
+    _PING_TEMPLATE = bytes([0xFF, 0xFF, 0xFD, 0x00, 0x00, 0x03, 0x00, INSTRUCTION_PING, 0x00, 0x00])
+
     def __init__(self, serial_interface: ISerialInterface, command_handler_class: ICommandHandler = None):
         """初期化
         """
 
+        # NumPy, Numbaの読み込み (初回のみ)
+        _load_accelerators()
+
         super(RobotisP20, self).__init__(serial_interface, command_handler_class)
 
-    def is_complete_response(self, response_data):
+    @staticmethod
+    def is_complete_response(response_data):
         """レスポンスデータをすべて受信できたかチェック"""
 
-        # Header, ID, Flags, Address, Length, Count, Data, Sum で7バイトは最低限ある
-        if len(response_data) < 6:
-            return False
-        else:
-            # カウント取得
-            count = response_data[5]
-            # logger.debug('###', count, len(response_data))
-            return len(response_data) >= (7 + count)
+        # Header(4), ID, Length(2bytes) で7バイトは最低限あり、Length以降のバイト数が揃っているか
+        size = len(response_data)
+        return size >= 7 and size >= 7 + (response_data[5] | (response_data[6] << 8))
 
-    def close(self, force=False):
-        """閉じる
+    def get_response_length(self, response_data):
+        """受信途中のレスポンスデータから、受信完了に必要なバイト数を取得
 
-        :param force:
+        :param response_data:
         :return:
         """
 
-        if self.command_handler:
-            self.command_handler.close()
+        # Header(4), ID, Length(2bytes) までの7バイト
+        if len(response_data) < 7:
+            return 7
 
-    def __get_checksum(self, data):
-        """チェックサム(CRC-16-IBM)を生成
+        # Length以降(Instruction, Error, Parameters, Checksum)のバイト数を足す
+        return 7 + (response_data[5] | (response_data[6] << 8))
 
-        :param data:
+    def close(self, force=False):
+        """閉じる
+
+        :param force:
         :return:
         """
 
-        # (X^16+X^15+X^2+1) Polynomial 0x8005
-        poly = 0x8005
-        n = 16
-        g = 1 << n | poly
-        crc = 0
-        for d in data:
-            crc ^= d << (n - 8)
-            for _ in range(8):
-                crc <<= 1
-                if crc & (1 << n):
-                    crc ^= g
-
-        # CRCを2bytesに
-        crc = self.get_bytes(crc, 2)
-
-        return crc
+        if self.command_handler:
+            self.command_handler.close()
 
     @staticmethod
     def __check_sid(sid):
@@ -174,9 +525,22 @@ class RobotisP20(Driver):
         """
 
         # 0~252(0x00~0xFC)の範囲及び254(0xFE)ならOK
-        if sid < 0 or sid > 254 or sid == 253:
+        if sid not in _VALID_SIDS:
             raise BadInputParametersException('sid: %d がレンジ外です。0~252(0x00~0xFC)の範囲及び254(0xFE)のIDを設定してください。' % sid)
 
+    @staticmethod
+    def __check_sids(sids):
+        """複数のServo IDのレンジをまとめてチェック
+
+        :param sids:
+        :return:
+        """
+
+        if not _VALID_SIDS.issuperset(sids):
+            # レンジ外のIDを探してエラーにする
+            for sid in sids:
+                RobotisP20.__check_sid(sid)
+
     def __generate_command(self, sid, instruction, parameters=None, length=None):
         """コマンド生成
 
@@ -196,13 +560,20 @@ class RobotisP20(Driver):
         # Checksum:    HeaderからParameterまでのチェックサム値(CRC-16-IBM)。
         #              (X^16+X^15+X^2+1) Polynomial 0x8005
 
-        command = []
+        # Header部と一致するデータ列のうしろに0xFDを追加 (C実装のbytes.replaceで1回で処理)
+        if parameters is not None:
+            parameters = bytes(parameters).replace(_HEADER_PATTERN, _STUFFED_HEADER_PATTERN)
+
+        parameters_length = len(parameters) if parameters is not None else 0
+
+        # Header(4), ID(1), Length(2), Instruction(1), Parameters, Checksum(2) 分のバッファを確保
+        command = bytearray(8 + parameters_length + 2)
 
         # Header
-        command.extend([0xFF, 0xFF, 0xFD, 0x00])
+        command[0:4] = b'\xff\xff\xfd\x00'
 
         # ID
-        command.append(sid)
+        command[4] = sid
 
         # Length
         if length is None:
@@ -215,77 +586,137 @@ class RobotisP20(Driver):
                 # パラメータなしなので、Instruction(1) + Checksum(2) = 3bytes
                 length = 3
 
-        # Lengthを2bytesのデータに変換
-        command.extend(self.get_bytes(length, 2))
+        # Length (2bytes)
+        _pack_into_u16(command, 5, length)
 
         # Instruction
-        command.append(instruction)
+        command[7] = instruction
 
         # Parameters
-        if parameters is not None and len(parameters) > 0:
-            command.extend(parameters)
+        if parameters_length > 0:
+            command[8:8 + parameters_length] = parameters
 
-        # Header部と一致するデータ列のうしろに0xFDを追加
-        # TODO
+        # Checksum (Instructionまではキャッシュ済みのCRCの続きから計算)
+        self.__set_checksum(command, 8, _header_crc(sid, length, instruction))
+
+        return command
+
+    def __generate_command_from_template(self, template, sid):
+        """テンプレートからコマンド生成 (IDとChecksumのみ書き換え)
+
+        :param template:
+        :param sid:
+        :return:
+        """
+
+        command = bytearray(template)
+
+        # ID
+        command[4] = sid
 
         # Checksum
-        command.extend(self.__get_checksum(command))
+        self.__set_checksum(command)
 
         return command
 
-    # def __generate_burst_command(self, addr, length, vid_data_dict):
-    #     """バーストコマンド生成
-    #
-    #     :param addr:
-    #     :param length:
-    #     :param vid_data_dict:
-    #     :return:
-    #     """
-    #
-    #     # Header:  パケットの先頭を表します。ショートパケットではFAAFに設定します。
-    #     # ID:      常に00
-    #     # Flag:    常に00
-    #     # Address: メモリーマップ上のアドレスを指定します。
-    #     #          このアドレスから「Length」に指定した長さ分のデータを指定した複数サーボのメモリーマップに書き込みます。
-    #     # Length:  サーボ1つ分のデータ (VID+Data) のバイト数を指定します。
-    #     # Count:   データを送信する対象となるサーボの数を表します。この数分 VID と Data を送信します。
-    #     # VID:     データを送信する個々のサーボの ID を表します。VID と Data が一組でサーボの数分のデータを送信します。
-    #     # Data:    メモリーマップに書き込むサーボ一つ分のデータです。VID と Data が一組でサーボの数分のデータを送信します。
-    #     # Sum:     送信データの確認用のチェックサムで、パケットのIDからDataの末尾までを1バイトずつ
-    #     #          XORした値を指定します。
-    #
-    #     command = []
-    #
-    #     # Header
-    #     command.extend([0xFA, 0xAF])
-    #
-    #     # ID
-    #     command.append(0)
-    #
-    #     # Flag
-    #     command.append(0)
-    #
-    #     # Address
-    #     command.append(addr)
-    #
-    #     # Length
-    #     command.append(length)
-    #
-    #     # Count
-    #     command.append(len(vid_data_dict))
-    #
-    #     # Data
-    #     for sid, data in vid_data_dict.items():
-    #         command.append(sid)
-    #         if data is not None and len(data) > 0:
-    #             command.extend(data)
-    #
-    #     # Checksum
-    #     command.append(self.__get_checksum(command))
-    #
-    #     return command
-
-    def __get_function(self, instruction, parameters, response_process=None, sid=1, length=None, callback=None):
+    def __generate_sync_write_command(self, address, length, count):
+        """Sync Writeコマンドのバッファ生成
+        ヘッダー部のみ設定済み。各サーボのID, Dataとチェックサムは呼び出し側で設定する
+
+        :param address: 書き込み先アドレス
+        :param length: サーボ1つ分のデータ長
+        :param count: サーボの数
+        :return:
+        """
+
+        command = bytearray(self.SYNC_WRITE_HEADER_LENGTH + count * (1 + length) + 2)
+        command[:self.SYNC_WRITE_HEADER_LENGTH] = _sync_write_header(address, length, count)
+
+        return command
+
+    def __stuff_command(self, command):
+        """生成済みのコマンドのパラメータ中のHeader部と一致するデータ列のうしろに0xFDを追加し、Lengthを更新
+        Checksum(末尾2bytes)は未設定のコマンドを渡す
+
+        :param command:
+        :return: スタッフィングが不要な場合はcommandをそのまま返す
+        """
+
+        if command.find(_HEADER_PATTERN, 8, len(command) - 2) < 0:
+            return command
+
+        parameters = bytes(command[8:-2]).replace(_HEADER_PATTERN, _STUFFED_HEADER_PATTERN)
+        stuffed_command = command[:8] + parameters + b'\x00\x00'
+
+        # Length: Instruction(1) + Parameters + Checksum(2)
+        _pack_into_u16(stuffed_command, 5, 1 + len(parameters) + 2)
+
+        return stuffed_command
+
+    def __set_checksum(self, command, start=0, crc=0):
+        """コマンド末尾の2bytesにチェックサムを設定
+
+        :param command:
+        :param start: CRCを計算済みのバイト数
+        :param crc: command[:start]までのCRC
+        :return:
+        """
+
+        crc = _crc16(memoryview(command)[start:-2], crc)
+        command[-2] = crc & 0xFF
+        command[-1] = crc >> 8
+
+    def __parse_status_packet(self, response, offset=0):
+        """受信データのoffsetの位置にあるステータスパケットを検証し、パラメータを取り出す
+        Sync Readのように連結されたステータスパケットは、戻り値の次の位置を使って順に取り出す
+
+        :param response: 受信データ
+        :param offset: ステータスパケットの先頭位置
+        :return: (サーボID, パラメータ, 次のステータスパケットの先頭位置)。パケットが不完全・不正な場合はNone
+        """
+
+        # パラメーターindexまでデータがあるか
+        if len(response) <= offset + self.STATUS_PACKET_PARAMETER_INDEX:
+            logger.debug('ステータスパケット長エラー')
+            return None
+
+        # ステータスパケットからInstructionを取得し、0x55かチェック
+        if response[offset + self.STATUS_PACKET_INSTRUCTION_INDEX] != self.STATUS_PACKET_INSTRUCTION:
+            logger.debug('ステータスパケット異常: Instructionが0x55ではありません')
+            return None
+
+        # ステータスパケットからlengthを取得
+        status_packet_length = _unpack_from_u16(response, offset + self.STATUS_PACKET_LENGTH_INDEX)[0]
+        checksum_index = offset + self.STATUS_PACKET_INSTRUCTION_INDEX + status_packet_length - 2
+        if len(response) < checksum_index + 2:
+            logger.debug('ステータスパケット異常: lengthのデータを受信できていません')
+            return None
+
+        # チェックサム検証 (受信データをコピーせずにCRCを計算し、受信したCRCと比較)
+        response_view = memoryview(response)
+        if _crc16(response_view[offset:checksum_index]) != _unpack_from_u16(response, checksum_index)[0]:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug('Check sum error: %s', get_printable_hex(response))
+            raise WrongCheckSumException('受信したデータのチェックサムが不正です')
+
+        # Errorバイトのチェック
+        sid = response[offset + 4]
+        status_packet_error = response[offset + self.STATUS_PACKET_ERROR_INDEX]
+        if status_packet_error != 0:
+            raise StatusErrorException('sid: %d からエラーステータス(0x%02X)が返されました' % (sid, status_packet_error))
+
+        # パラメータ取得 (コピーしないようにmemoryviewで切り出す)
+        parameter_index = offset + self.STATUS_PACKET_PARAMETER_INDEX
+        response_data = response_view[parameter_index:checksum_index]
+
+        # バイトスタッフィングで追加された0xFDを取り除く
+        if response.find(_STUFFED_HEADER_PATTERN, parameter_index, checksum_index) >= 0:
+            response_data = bytes(response_data).replace(_STUFFED_HEADER_PATTERN, _HEADER_PATTERN)
+
+        return sid, response_data, checksum_index + 2
+
+    def __get_function(self, instruction, parameters, response_process=None, sid=1, length=None, callback=None,
+                       command=None, response_length=None):
         """Get系の処理をまとめた関数
 
         :param instruction:
@@ -294,6 +725,8 @@ class RobotisP20(Driver):
         :param sid:
         :param length:
         :param callback:
+        :param command: 生成済みのコマンド。指定時はコマンド生成を省略する
+        :param response_length: レスポンスのパラメータのデータ長。指定時はresponse_processの前にチェックする
         :return:
         """
 
@@ -303,98 +736,176 @@ class RobotisP20(Driver):
         # 受信済みフラグ
         is_received = False
 
-        # チェックサム不正エラー
-        is_checksum_error = False
+        # 受信処理で発生したエラー (チェックサム不正, エラーステータス, データ長不正)
+        recv_error = None
 
         def temp_recv_callback(response):
             nonlocal data
             nonlocal is_received
-            nonlocal is_checksum_error
-
-            # ステータスパケットのチェックサムが正しいかチェック
-            if len(response) > 2:
-                # パラメーターindexまでデータがあるか
-                if len(response) <= self.STATUS_PACKET_PARAMETER_INDEX:
-                    # TODO: ステータスパケット長エラーexception
-                    print('ステータスパケット長エラーexception')
-                    return
+            nonlocal recv_error
 
-                # ステータスパケットからInstructionを取得し、0x55かチェック
-                status_packet_instruction = response[self.STATUS_PACKET_INSTRUCTION_INDEX]
-                if status_packet_instruction != self.STATUS_PACKET_INSTRUCTION:
-                    # TODO: ステータスパケット異常exception
-                    print('ステータスパケット異常exception ステータスパケットからInstructionを取得し、0x55かチェック')
-                    return
+            # ステータスパケットの検証とパラメータの取り出し
+            try:
+                status_packet = self.__parse_status_packet(response)
+            except (WrongCheckSumException, StatusErrorException) as e:
+                recv_error = e
+                return
 
-                # ステータスパケットからlengthを取得
-                status_packet_length = response[self.STATUS_PACKET_LENGTH_INDEX:self.STATUS_PACKET_LENGTH_INDEX + 2]
-                status_packet_length = int.from_bytes(status_packet_length, 'little', signed=True)
+            if status_packet is None:
+                return
 
-                if len(response) < self.STATUS_PACKET_INSTRUCTION_INDEX + status_packet_length:
-                    # print('FFFF', len(response), self.STATUS_PACKET_INSTRUCTION_INDEX + status_packet_length)
-                    # TODO: ステータスパケット異常exception
-                    print('ステータスパケット異常exception ステータスパケットからlengthを取得')
-                    print('########', response)
-                    return
+            _, response_data, _ = status_packet
 
-                # Errorバイト取得
-                status_packet_error = response[self.STATUS_PACKET_ERROR_INDEX]
+            # データ長のチェック (コールバックのスレッドではなく呼び出し元で例外にする)
+            if response_length is not None and len(response_data) != response_length:
+                recv_error = InvalidResponseDataException('サーボからのレスポンスデータが不正です')
+                return
 
-                if status_packet_error > 0:
-                    # TODO: ステータスパケットエラーexception
-                    print('ステータスパケットエラーexception')
-                    return
+            # 受信済み
+            is_received = True
 
-                # パラメータ取得
-                response_data = response[
-                                self.STATUS_PACKET_PARAMETER_INDEX:
-                                self.STATUS_PACKET_INSTRUCTION_INDEX + status_packet_length - 2
-                                ]
-
-                # チェックサム検証
-                checksum = response[
-                           self.STATUS_PACKET_INSTRUCTION_INDEX + status_packet_length - 2:
-                           self.STATUS_PACKET_INSTRUCTION_INDEX + status_packet_length]
-                generated_checksum = self.__get_checksum(
-                    response[:self.STATUS_PACKET_INSTRUCTION_INDEX + status_packet_length - 2]
+            # データ処理
+            if response_process:
+                recv_data = response_process(response_data)
+            else:
+                recv_data = bytes(response_data)
+
+            if callback is not None:
+                callback(recv_data)
+            else:
+                data = recv_data
+
+        # 受信処理の完了通知
+        done = threading.Event()
+
+        def recv_callback(response):
+            try:
+                temp_recv_callback(response)
+            finally:
+                done.set()
+
+        if command is None:
+            command = self.__generate_command(sid, instruction, parameters, length=length)
+        self.command_handler.add_command(command, recv_callback=recv_callback)
+
+        # コールバックが設定できていたら、コールバックに受信データを渡す
+        if callback is None:
+            # X秒以内にサーボからデータを受信できたかをチェック (受信処理の完了まで待機する)
+            done.wait(self.command_handler.RECEIVE_DATA_TIMEOUT_SEC)
+            if recv_error is not None:
+                raise recv_error
+            elif not is_received:
+                raise ReceiveDataTimeoutException(
+                    str(self.command_handler.RECEIVE_DATA_TIMEOUT_SEC) + '秒以内にデータ受信できませんでした'
                 )
-                if checksum[0] != generated_checksum[0] or checksum[1] != generated_checksum[1]:
-                    logger.debug('Check sum error: ' + get_printable_hex(response))
-                    is_checksum_error = True
+
+            return data
+        else:
+            return True
+
+    def __sync_read(self, address, length, sids, response_process, callback=None, vectorized=False):
+        """Sync Readの処理をまとめた関数
+        1つのコマンドで複数のサーボのデータを読み込み、{sid: データ}を返す
+
+        :param address: 読み込み先アドレス
+        :param length: サーボ1つ分のデータ長
+        :param sids: サーボIDのリスト
+        :param response_process: サーボ1つ分のデータの変換関数
+            vectorized=Trueの場合は、(サーボIDのリスト, 連結したデータ)から{sid: データ}を返す変換関数
+        :param callback:
+        :param vectorized: 全サーボ分のデータを連結してresponse_processで一度に変換するか
+        :return:
+        """
+
+        # サーボが指定されていなければ送信しない (返信がないのでタイムアウトまで通信が止まってしまう)
+        if not sids:
+            if callback is not None:
+                callback({})
+                return True
+            return {}
+
+        # データ
+        data = None
+
+        # 受信済みフラグ
+        is_received = False
+
+        # 受信処理で発生したエラー (チェックサム不正, エラーステータス, データ長不正)
+        recv_error = None
+
+        def temp_recv_callback(response):
+            nonlocal data
+            nonlocal is_received
+            nonlocal recv_error
+
+            recv_data = {}
+            offset = 0
+
+            # まとめて変換する場合のサーボIDと連結したデータ
+            recv_sids = []
+            recv_payload = bytearray()
+
+            # サーボの数だけステータスパケットが連結されている
+            for _ in range(len(sids)):
+                # ステータスパケットの検証とパラメータの取り出し
+                try:
+                    status_packet = self.__parse_status_packet(response, offset)
+                except (WrongCheckSumException, StatusErrorException) as e:
+                    recv_error = e
                     return
 
-                # 受信済み
-                is_received = True
+                if status_packet is None:
+                    return
 
-                # データ処理
-                if response_process:
-                    recv_data = response_process(response_data)
-                else:
-                    recv_data = response_data
+                sid, response_data, offset = status_packet
+
+                # データ長のチェック (コールバックのスレッドではなく呼び出し元で例外にする)
+                if len(response_data) != length:
+                    recv_error = InvalidResponseDataException('サーボからのレスポンスデータが不正です')
+                    return
 
-                if callback is not None:
-                    callback(recv_data)
+                if vectorized:
+                    recv_sids.append(sid)
+                    recv_payload += response_data
                 else:
-                    data = recv_data
+                    recv_data[sid] = response_process(response_data)
+
+            if vectorized:
+                recv_data = response_process(recv_sids, recv_payload)
+
+            # 受信済み
+            is_received = True
+
+            if callback is not None:
+                callback(recv_data)
             else:
-                # TODO: 受信エラー
-                return
+                data = recv_data
+
+        # 受信処理の完了通知
+        done = threading.Event()
+
+        def recv_callback(response):
+            try:
+                temp_recv_callback(response)
+            finally:
+                done.set()
 
-        command = self.__generate_command(sid, instruction, parameters, length=length)
-        self.command_handler.add_command(command, recv_callback=temp_recv_callback)
+        # コマンド生成 (キャッシュ済みのSync Readコマンド)
+        command = _sync_read_command(address, length, tuple(sids))
+
+        # サーボの数だけステータスパケットが返ってくる
+        self.command_handler.add_command(command, recv_callback=recv_callback, response_count=len(sids))
 
         # コールバックが設定できていたら、コールバックに受信データを渡す
         if callback is None:
-            # X秒以内にサーボからデータを受信できたかをチェック
-            start = time.time()
-            while not is_received:
-                elapsed_time = time.time() - start
-                if elapsed_time > self.command_handler.RECEIVE_DATA_TIMEOUT_SEC:
-                    raise ReceiveDataTimeoutException(
-                        str(self.command_handler.RECEIVE_DATA_TIMEOUT_SEC) + '秒以内にデータ受信できませんでした'
-                    )
-                elif is_checksum_error:
-                    raise WrongCheckSumException('受信したデータのチェックサムが不正です')
+            # X秒以内にサーボからデータを受信できたかをチェック (受信処理の完了まで待機する)
+            done.wait(self.command_handler.RECEIVE_DATA_TIMEOUT_SEC)
+            if recv_error is not None:
+                raise recv_error
+            elif not is_received:
+                raise ReceiveDataTimeoutException(
+                    str(self.command_handler.RECEIVE_DATA_TIMEOUT_SEC) + '秒以内にデータ受信できませんでした'
+                )
 
             return data
         else:
@@ -409,11 +920,8 @@ class RobotisP20(Driver):
         :return:
         """
 
-        params = []
-        params.extend(self.get_bytes(start_address, 2))
-        params.extend(self.get_bytes(data, data_size))
-
-        return params
+        # Address(2bytes) + Data(data_size bytes) (little-endian)
+        return _pack_u16(start_address) + (int(data) & ((1 << (8 * data_size)) - 1)).to_bytes(data_size, 'little')
 
     def __callback_write_response(self, response_data):
         """WRITEインストラクション時の返り値ハンドリング
@@ -422,10 +930,9 @@ class RobotisP20(Driver):
         :return:
         """
 
-        # 返り値
+        # 返り値 (WRITEのステータスパケットにはパラメータがない)
         if len(response_data) != 0:
-            # TODO: レスポンス以上exception
-            print('WRITEインストラクション返り値レスポンス以上exception')
+            logger.warning('WRITEインストラクションのレスポンスが不正です: %s', get_printable_hex(response_data))
 
     def ping(self, sid, callback=None):
         """サーボにPINGを送る
@@ -441,30 +948,12 @@ class RobotisP20(Driver):
         # サーボIDのチェック
         self.__check_sid(sid)
 
-        def response_process(response_data):
-            if response_data is not None and len(response_data) == 3:
-                model_no = response_data[0:2]
-                version_firmware = response_data[2]
-                return {
-                    'model_no': model_no,
-                    'version_firmware': version_firmware
-                }
-            else:
-                raise InvalidResponseDataException('サーボからのレスポンスデータが不正です')
+        command = self.__generate_command_from_template(self._PING_TEMPLATE, sid)
 
-        return self.__get_function(self.INSTRUCTION_PING, None, response_process, sid=sid, length=3, callback=callback)
+        return self.__get_function(self.INSTRUCTION_PING, None, _parse_ping, sid=sid, callback=callback,
+                                   command=command, response_length=3)
 
-    def ping_async(self, sid, loop=None):
-        """サーボにPINGを送る async版
-
-        :param sid:
-        :param loop:
-        :return:
-        """
-
-        f, callback = self.async_wrapper(loop)
-        self.ping(sid, callback=callback)
-        return f
+    ping_async = async_method(ping)
 
     def get_torque_enable(self, sid, callback=None):
         """トルクON取得
@@ -477,27 +966,13 @@ class RobotisP20(Driver):
         # サーボIDのチェック
         self.__check_sid(sid)
 
-        def response_process(response_data):
-            if response_data is not None and len(response_data) == 1:
-                return response_data[0] == 0x01
-            else:
-                raise InvalidResponseDataException('サーボからのレスポンスデータが不正です')
-
-        params = self.__generate_parameters_read_write(self.ADDR_TORQUE_ENABLE, 1, 2)
-
-        return self.__get_function(self.INSTRUCTION_READ, params, response_process, sid=sid, callback=callback)
+        # コマンド生成 (キャッシュ済みのREADコマンド)
+        command = _read_command(sid, _ADDR_TORQUE_ENABLE, 1)
 
-    def get_torque_enable_async(self, sid, loop=None):
-        """トルクON取得async版
+        return self.__get_function(self.INSTRUCTION_READ, None, _parse_bool, sid=sid, callback=callback,
+                                   command=command, response_length=1)
 
-        :param sid:
-        :param loop:
-        :return:
-        """
-
-        f, callback = self.async_wrapper(loop)
-        self.get_torque_enable(sid, callback=callback)
-        return f
+    get_torque_enable_async = async_method(get_torque_enable)
 
     def set_torque_enable(self, on_off, sid):
         """トルクON/OFF設定
@@ -510,17 +985,11 @@ class RobotisP20(Driver):
         # サーボIDのチェック
         self.__check_sid(sid)
 
-        def response_process(response_data):
-            if response_data is not None and len(response_data) == 1:
-                return response_data[0] == 0x01
-            else:
-                raise InvalidResponseDataException('サーボからのレスポンスデータが不正です')
-
         # トルクデータ
         torque_data = 0x01 if on_off else 0x00
 
         # コマンド生成
-        params = self.__generate_parameters_read_write(self.ADDR_TORQUE_ENABLE, torque_data, 2)
+        params = self.__generate_parameters_read_write(_ADDR_TORQUE_ENABLE, torque_data, 2)
 
         return self.__get_function(self.INSTRUCTION_WRITE, params, sid=sid, callback=self.__callback_write_response)
 
@@ -535,28 +1004,13 @@ class RobotisP20(Driver):
         # サーボIDのチェック
         self.__check_sid(sid)
 
-        def response_process(response_data):
-            if response_data is not None and len(response_data) == 1:
-                temperature = int.from_bytes(response_data, 'little', signed=True)
-                return temperature
-            else:
-                raise InvalidResponseDataException('サーボからのレスポンスデータが不正です')
+        # コマンド生成 (キャッシュ済みのREADコマンド)
+        command = _read_command(sid, _ADDR_PRESENT_TEMPERATURE, 1)
 
-        params = self.__generate_parameters_read_write(self.ADDR_PRESENT_TEMPERATURE, 1, 2)
+        return self.__get_function(self.INSTRUCTION_READ, None, _parse_int8, sid=sid, callback=callback,
+                                   command=command, response_length=1)
 
-        return self.__get_function(self.INSTRUCTION_READ, params, response_process, sid=sid, callback=callback)
-
-    def get_temperature_async(self, sid, loop=None):
-        """温度取得 async版（単位: ℃。おおよそ±3℃程度の誤差あり）
-
-        :param sid:
-        :param loop:
-        :return:
-        """
-
-        f, callback = self.async_wrapper(loop)
-        self.get_temperature(sid, callback=callback)
-        return f
+    get_temperature_async = async_method(get_temperature)
 
     def get_current(self, sid, callback=None):
         """電流(現在の負荷)取得 (単位: mA)
@@ -569,27 +1023,7 @@ class RobotisP20(Driver):
         # サーボIDのチェック
         self.__check_sid(sid)
 
-        # def response_process(response_data):
-        #     if response_data is not None and len(response_data) == 2:
-        #         current = int.from_bytes(response_data, 'little', signed=False)
-        #         return current
-        #     else:
-        #         raise InvalidResponseDataException('サーボからのレスポンスデータが不正です')
-        #
-        # return self.__get_function(self.ADDR_PRESENT_CURRENT_L, self.FLAG30_MEM_MAP_SELECT, 2, response_process,
-        #                            sid=sid, callback=callback)
-
-    def get_current_async(self, sid, loop=None):
-        """電流(現在の負荷)取得 async版 (単位: mA)
-
-        :param sid:
-        :param loop:
-        :return:
-        """
-
-        f, callback = self.async_wrapper(loop)
-        self.get_current(sid, callback=callback)
-        return f
+    get_current_async = async_method(get_current)
 
     def get_target_position(self, sid, callback=None):
         """指示位置取得 (単位: 度)
@@ -602,32 +1036,13 @@ class RobotisP20(Driver):
         # サーボIDのチェック
         self.__check_sid(sid)
 
-        def response_process(response_data):
-            if response_data is not None and len(response_data) == 4:
-                # 単位は 0.1 度になっているので、度に変換
-                position = int.from_bytes(response_data, 'little', signed=True)
-                position = position * 360 / 4096
-                position = position - 180
-                return position
-            else:
-                raise InvalidResponseDataException('サーボからのレスポンスデータが不正です')
-
-        # コマンド生成
-        params = self.__generate_parameters_read_write(self.ADDR_GOAL_POSITION, 4, 2)
+        # コマンド生成 (キャッシュ済みのREADコマンド)
+        command = _read_command(sid, _ADDR_GOAL_POSITION, 4)
 
-        return self.__get_function(self.INSTRUCTION_READ, params, response_process, sid=sid, callback=callback)
+        return self.__get_function(self.INSTRUCTION_READ, None, _parse_position, sid=sid, callback=callback,
+                                   command=command, response_length=4)
 
-    def get_target_position_async(self, sid, loop=None):
-        """指示位置取得 async版 (単位: 度)
-
-        :param sid:
-        :param loop:
-        :return:
-        """
-
-        f, callback = self.async_wrapper(loop)
-        self.get_target_position(sid, callback=callback)
-        return f
+    get_target_position_async = async_method(get_target_position)
 
     def set_target_position(self, position_degree, sid=1):
         """指示位置設定 (単位: 度。設定可能な範囲は-180.0 度~+180.0 度)
@@ -641,19 +1056,13 @@ class RobotisP20(Driver):
         self.__check_sid(sid)
 
         # 位置 (-180から180まで)
-        if position_degree < -180:
-            position_degree = -180
-        elif position_degree > 180:
-            position_degree = 180
-
-        # Dynamixelでは0〜360°なので変換
-        position_degree += 180
+        position_degree = max(-180, min(180, position_degree))
 
-        # データ変換
-        position_degree = position_degree * 4096 / 360
+        # Dynamixelでは0〜360°なので変換し、データ変換
+        position = int(round((position_degree + 180) * _DEG_TO_RAW))
 
         # コマンド生成
-        params = self.__generate_parameters_read_write(self.ADDR_GOAL_POSITION, position_degree, 4)
+        params = self.__generate_parameters_read_write(_ADDR_GOAL_POSITION, position, 4)
 
         return self.__get_function(self.INSTRUCTION_WRITE, params, sid=sid, callback=self.__callback_write_response)
 
@@ -668,32 +1077,13 @@ class RobotisP20(Driver):
         # サーボIDのチェック
         self.__check_sid(sid)
 
-        def response_process(response_data):
-            if response_data is not None and len(response_data) == 4:
-                # 単位は 0.1 度になっているので、度に変換
-                position = int.from_bytes(response_data, 'little', signed=True)
-                position = position * 360 / 4096
-                position = position - 180
-                return position
-            else:
-                raise InvalidResponseDataException('サーボからのレスポンスデータが不正です')
+        # コマンド生成 (キャッシュ済みのREADコマンド)
+        command = _read_command(sid, _ADDR_PRESENT_POSITION, 4)
 
-        # コマンド生成
-        params = self.__generate_parameters_read_write(self.ADDR_PRESENT_POSITION, 4, 2)
+        return self.__get_function(self.INSTRUCTION_READ, None, _parse_position, sid=sid, callback=callback,
+                                   command=command, response_length=4)
 
-        return self.__get_function(self.INSTRUCTION_READ, params, response_process, sid=sid, callback=callback)
-
-    def get_current_position_async(self, sid, loop=None):
-        """現在位置取得 async版 (単位: 度)
-
-        :param sid:
-        :param loop:
-        :return:
-        """
-
-        f, callback = self.async_wrapper(loop)
-        self.get_current_position(sid, callback=callback)
-        return f
+    get_current_position_async = async_method(get_current_position)
 
     def get_voltage(self, sid, callback=None):
         """電圧取得 (単位: V)
@@ -706,28 +1096,7 @@ class RobotisP20(Driver):
         # サーボIDのチェック
         self.__check_sid(sid)
 
-        # def response_process(response_data):
-        #     if response_data is not None and len(response_data) == 2:
-        #         voltage = int.from_bytes(response_data, 'little', signed=True)
-        #         voltage /= 100
-        #         return voltage
-        #     else:
-        #         raise InvalidResponseDataException('サーボからのレスポンスデータが不正です')
-        #
-        # return self.__get_function(self.ADDR_VOLTAGE_L, self.FLAG30_MEM_MAP_SELECT, 2, response_process,
-        #                            sid=sid, callback=callback)
-
-    def get_voltage_async(self, sid, loop=None):
-        """電圧取得 async版 (単位: V)
-
-        :param sid:
-        :param loop:
-        :return:
-        """
-
-        f, callback = self.async_wrapper(loop)
-        self.get_voltage(sid, callback=callback)
-        return f
+    get_voltage_async = async_method(get_voltage)
 
     def get_target_time(self, sid, callback=None):
         """目標位置までのサーボ移動時間を取得 (単位: 秒)
@@ -740,29 +1109,7 @@ class RobotisP20(Driver):
         # サーボIDのチェック
         self.__check_sid(sid)
 
-        # def response_process(response_data):
-        #     if response_data is not None and len(response_data) == 2:
-        #         # 単位は 10ms 単位になっているので、秒に変更
-        #         speed = int.from_bytes(response_data, 'little', signed=False)
-        #         speed /= 100
-        #         return speed
-        #     else:
-        #         raise InvalidResponseDataException('サーボからのレスポンスデータが不正です')
-        #
-        # return self.__get_function(self.ADDR_GOAL_TIME_L, self.FLAG30_MEM_MAP_SELECT, 2, response_process,
-        #                            sid=sid, callback=callback)
-
-    def get_target_time_async(self, sid, loop=None):
-        """目標位置までのサーボ移動時間を取得 async版 (単位: 秒)
-
-        :param sid:
-        :param loop:
-        :return:
-        """
-
-        f, callback = self.async_wrapper(loop)
-        self.get_speed(sid, callback=callback)
-        return f
+    get_target_time_async = async_method(get_target_time)
 
     def set_target_time(self, speed_second, sid):
         """目標位置までのサーボ移動時間を設定 (単位: 秒)
@@ -775,23 +1122,6 @@ class RobotisP20(Driver):
         # サーボIDのチェック
         self.__check_sid(sid)
 
-        # # 設定範囲は 0 から 3FFFH。つまり0秒から163830ms=163.83seconds
-        # if speed_second < 0:
-        #     speed_second = 0
-        # elif speed_second > 163.83:
-        #     speed_second = 163.83
-        #
-        # # 10ms 単位で設定。この関数のパラメータは秒指定なので*100する
-        # speed_hex = format(int(speed_second * 100) & 0xffff, '04x')
-        # speed_hex_h = int(speed_hex[0:2], 16)
-        # speed_hex_l = int(speed_hex[2:4], 16)
-        #
-        # # コマンド生成
-        # command = self.__generate_command(sid, self.ADDR_GOAL_TIME_L, [speed_hex_l, speed_hex_h])
-        #
-        # # データ送信バッファに追加
-        # self.add_command_queue(command)
-
     def get_pid_coefficient(self, sid, callback=None):
         """モータの制御係数を取得 (単位: %)
 
@@ -803,27 +1133,7 @@ class RobotisP20(Driver):
         # サーボIDのチェック
         self.__check_sid(sid)
 
-        # def response_process(response_data):
-        #     if response_data is not None and len(response_data) == 1:
-        #         coef = response_data[0]
-        #         return coef
-        #     else:
-        #         raise InvalidResponseDataException('サーボからのレスポンスデータが不正です')
-        #
-        # return self.__get_function(self.ADDR_PID_COEFFICIENT, self.FLAG30_MEM_MAP_SELECT, 1, response_process,
-        #                            sid=sid, callback=callback)
-
-    def get_pid_coefficient_async(self, sid, loop=None):
-        """モータの制御係数を取得 async版 (単位: %)
-
-        :param sid:
-        :param loop:
-        :return:
-        """
-
-        f, callback = self.async_wrapper(loop)
-        self.get_pid_coefficient(sid, callback=callback)
-        return f
+    get_pid_coefficient_async = async_method(get_pid_coefficient)
 
     def set_pid_coefficient(self, coef_percent, sid):
         """モータの制御係数を設定 (単位: %)
@@ -836,23 +1146,6 @@ class RobotisP20(Driver):
         # サーボIDのチェック
         self.__check_sid(sid)
 
-        # # 100%のとき設定値は、64H となります。設定範囲は 01H~FFH までです。
-        # if coef_percent < 1:
-        #     coef_percent = 1
-        # elif coef_percent == 10:
-        #     # なぜか10に設定すると反応がおかしいので9にシフトさせる
-        #     coef_percent = 9
-        # elif coef_percent > 255:
-        #     coef_percent = 255
-        #
-        # coef_hex = int(coef_percent)
-        #
-        # # コマンド生成
-        # command = self.__generate_command(sid, self.ADDR_PID_COEFFICIENT, [coef_hex])
-        #
-        # # データ送信バッファに追加
-        # self.add_command_queue(command)
-
     def get_max_torque(self, sid, callback=None):
         """最大トルク取得 (%)
 
@@ -864,27 +1157,7 @@ class RobotisP20(Driver):
         # サーボIDのチェック
         self.__check_sid(sid)
 
-        # def response_process(response_data):
-        #     if response_data is not None and len(response_data) == 1:
-        #         max_torque = response_data[0]
-        #         return max_torque
-        #     else:
-        #         raise InvalidResponseDataException('サーボからのレスポンスデータが不正です')
-        #
-        # return self.__get_function(self.ADDR_MAX_TORQUE, self.FLAG30_MEM_MAP_SELECT, 1, response_process,
-        #                            sid=sid, callback=callback)
-
-    def get_max_torque_async(self, sid, loop=None):
-        """最大トルク取得 async版 (%)
-
-        :param sid:
-        :param loop:
-        :return:
-        """
-
-        f, callback = self.async_wrapper(loop)
-        self.get_max_torque(sid, callback=callback)
-        return f
+    get_max_torque_async = async_method(get_max_torque)
 
     def set_max_torque(self, torque_percent, sid):
         """最大トルク設定 (%)
@@ -897,20 +1170,6 @@ class RobotisP20(Driver):
         # サーボIDのチェック
         self.__check_sid(sid)
 
-        # # 0-100%で設定
-        # if torque_percent < 0:
-        #     torque_percent = 0
-        # elif torque_percent > 100:
-        #     torque_percent = 100
-        #
-        # torque_hex = int(torque_percent)
-        #
-        # # コマンド生成
-        # command = self.__generate_command(sid, self.ADDR_MAX_TORQUE, [torque_hex])
-        #
-        # # データ送信バッファに追加
-        # self.add_command_queue(command)
-
     def get_speed(self, sid, callback=None):
         """現在の回転速度を取得 (deg/s)
 
@@ -922,27 +1181,7 @@ class RobotisP20(Driver):
         # サーボIDのチェック
         self.__check_sid(sid)
 
-        # def response_process(response_data):
-        #     if response_data is not None and len(response_data) == 2:
-        #         speed = int.from_bytes(response_data, 'little', signed=True)
-        #         return speed
-        #     else:
-        #         raise InvalidResponseDataException('サーボからのレスポンスデータが不正です')
-        #
-        # return self.__get_function(self.ADDR_PRESENT_SPEED_L, self.FLAG30_MEM_MAP_SELECT, 2, response_process,
-        #                            sid=sid, callback=callback)
-
-    def get_speed_async(self, sid, loop=None):
-        """現在の回転速度を取得 async版 (deg/s)
-
-        :param sid:
-        :param loop:
-        :return:
-        """
-
-        f, callback = self.async_wrapper(loop)
-        self.get_speed(sid, callback=callback)
-        return f
+    get_speed_async = async_method(get_speed)
 
     def set_speed(self, dps, sid):
         """Futabaでは未サポート"""
@@ -959,27 +1198,7 @@ class RobotisP20(Driver):
         # サーボIDのチェック
         self.__check_sid(sid)
 
-        # def response_process(response_data):
-        #     if response_data is not None and len(response_data) == 1:
-        #         servo_id = int.from_bytes(response_data, 'little', signed=False)
-        #         return servo_id
-        #     else:
-        #         raise InvalidResponseDataException('サーボからのレスポンスデータが不正です')
-        #
-        # return self.__get_function(self.ADDR_SERVO_ID, self.FLAG30_MEM_MAP_SELECT, 1, response_process,
-        #                            sid=sid, callback=callback)
-
-    def get_servo_id_async(self, sid, loop=None):
-        """サーボIDを取得 async版
-
-        :param sid:
-        :param loop:
-        :return:
-        """
-
-        f, callback = self.async_wrapper(loop)
-        self.get_servo_id(sid, callback=callback)
-        return f
+    get_servo_id_async = async_method(get_servo_id)
 
     def set_servo_id(self, new_sid, sid):
         """サーボIDを設定
@@ -993,20 +1212,6 @@ class RobotisP20(Driver):
         self.__check_sid(new_sid)
         self.__check_sid(sid)
 
-        # # 0-100%で設定
-        # if new_sid < 1:
-        #     new_sid = 1
-        # elif new_sid > 127:
-        #     new_sid = 127
-        #
-        # new_sid_hex = int(new_sid)
-        #
-        # # コマンド生成
-        # command = self.__generate_command(sid, self.ADDR_SERVO_ID, [new_sid_hex])
-        #
-        # # データ送信バッファに追加
-        # self.add_command_queue(command)
-
     def save_rom(self, sid):
         """フラッシュROMに書き込む
 
@@ -1017,12 +1222,6 @@ class RobotisP20(Driver):
         # サーボIDのチェック
         self.__check_sid(sid)
 
-        # # コマンド生成
-        # command = self.__generate_command(sid, self.ADDR_WRITE_FLASH_ROM, flag=0x40, count=0)
-        #
-        # # データ送信バッファに追加
-        # self.add_command_queue(command)
-
     def get_baud_rate(self, sid, callback=None):
         """通信速度を取得
 
@@ -1034,27 +1233,7 @@ class RobotisP20(Driver):
         # サーボIDのチェック
         self.__check_sid(sid)
 
-        # def response_process(response_data):
-        #     if response_data is not None and len(response_data) == 1:
-        #         baud_rate = int.from_bytes(response_data, 'little', signed=False)
-        #         return baud_rate
-        #     else:
-        #         raise InvalidResponseDataException('サーボからのレスポンスデータが不正です')
-        #
-        # return self.__get_function(self.ADDR_BAUD_RATE, self.FLAG30_MEM_MAP_SELECT, 1, response_process,
-        #                            sid=sid, callback=callback)
-
-    def get_baud_rate_async(self, sid, loop=None):
-        """通信速度を取得 async版
-
-        :param sid:
-        :param loop:
-        :return:
-        """
-
-        f, callback = self.async_wrapper(loop)
-        self.get_baud_rate(sid, callback=callback)
-        return f
+    get_baud_rate_async = async_method(get_baud_rate)
 
     def set_baud_rate(self, baud_rate_id, sid):
         """通信速度を設定
@@ -1067,18 +1246,6 @@ class RobotisP20(Driver):
         # サーボIDのチェック
         self.__check_sid(sid)
 
-        # # 通信速度IDのチェック
-        # if self.BAUD_RATE_INDEX_9600 < baud_rate_id > self.BAUD_RATE_INDEX_230400:
-        #     raise BadInputParametersException('baud_rate_id が不正な値です')
-        #
-        # baud_rate_id_hex = int(baud_rate_id)
-        #
-        # # コマンド生成
-        # command = self.__generate_command(sid, self.ADDR_BAUD_RATE, [baud_rate_id_hex])
-        #
-        # # データ送信バッファに追加
-        # self.add_command_queue(command)
-
     def get_limit_cw_position(self, sid, callback=None):
         """右(時計回り)リミット角度の取得
 
@@ -1090,28 +1257,7 @@ class RobotisP20(Driver):
         # サーボIDのチェック
         self.__check_sid(sid)
 
-        # def response_process(response_data):
-        #     if response_data is not None and len(response_data) == 2:
-        #         limit_position = int.from_bytes(response_data, 'little', signed=True)
-        #         limit_position /= 10
-        #         return limit_position
-        #     else:
-        #         raise InvalidResponseDataException('サーボからのレスポンスデータが不正です')
-        #
-        # return self.__get_function(self.ADDR_CW_ANGLE_LIMIT_L, self.FLAG30_MEM_MAP_SELECT, 2, response_process,
-        #                            sid=sid, callback=callback)
-
-    def get_limit_cw_position_async(self, sid, loop=None):
-        """右(時計回り)リミット角度の取得 async版
-
-        :param sid:
-        :param loop:
-        :return:
-        """
-
-        f, callback = self.async_wrapper(loop)
-        self.get_limit_cw_position(sid, callback=callback)
-        return f
+    get_limit_cw_position_async = async_method(get_limit_cw_position)
 
     def set_limit_cw_position(self, limit_position, sid):
         """右(時計回り)リミット角度を設定
@@ -1124,20 +1270,6 @@ class RobotisP20(Driver):
         # サーボIDのチェック
         self.__check_sid(sid)
 
-        # # リミット角度のチェック
-        # if 0 < limit_position > 150:
-        #     raise BadInputParametersException('limit_position が不正な値です。0〜+150を設定してください。')
-        #
-        # limit_position_hex = format(int(limit_position * 10) & 0xffff, '04x')
-        # limit_position_hex_h = int(limit_position_hex[0:2], 16)
-        # limit_position_hex_l = int(limit_position_hex[2:4], 16)
-        #
-        # # コマンド生成
-        # command = self.__generate_command(sid, self.ADDR_CW_ANGLE_LIMIT_L, [limit_position_hex_l, limit_position_hex_h])
-        #
-        # # データ送信バッファに追加
-        # self.add_command_queue(command)
-
     def get_limit_ccw_position(self, sid, callback=None):
         """左(反時計回り)リミット角度の取得
 
@@ -1149,28 +1281,7 @@ class RobotisP20(Driver):
         # サーボIDのチェック
         self.__check_sid(sid)
 
-        # def response_process(response_data):
-        #     if response_data is not None and len(response_data) == 2:
-        #         limit_position = int.from_bytes(response_data, 'little', signed=True)
-        #         limit_position /= 10
-        #         return limit_position
-        #     else:
-        #         raise InvalidResponseDataException('サーボからのレスポンスデータが不正です')
-        #
-        # return self.__get_function(self.ADDR_CCW_ANGLE_LIMIT_L, self.FLAG30_MEM_MAP_SELECT, 2, response_process,
-        #                            sid=sid, callback=callback)
-
-    def get_limit_ccw_position_async(self, sid, loop=None):
-        """左(反時計回り)リミット角度の取得 async版
-
-        :param sid:
-        :param loop:
-        :return:
-        """
-
-        f, callback = self.async_wrapper(loop)
-        self.get_limit_ccw_position(sid, callback=callback)
-        return f
+    get_limit_ccw_position_async = async_method(get_limit_ccw_position)
 
     def set_limit_ccw_position(self, limit_position, sid):
         """左(反時計回り)リミット角度を設定
@@ -1183,21 +1294,6 @@ class RobotisP20(Driver):
         # サーボIDのチェック
         self.__check_sid(sid)
 
-        # # リミット角度のチェック
-        # if -150 < limit_position > 0:
-        #     raise BadInputParametersException('limit_position が不正な値です。-150〜0を設定してください。')
-        #
-        # limit_position_hex = format(int(limit_position * 10 & 0xffff), '04x')
-        # limit_position_hex_h = int(limit_position_hex[0:2], 16)
-        # limit_position_hex_l = int(limit_position_hex[2:4], 16)
-        #
-        # # コマンド生成
-        # command = self.__generate_command(sid, self.ADDR_CCW_ANGLE_LIMIT_L,
-        #                                   [limit_position_hex_l, limit_position_hex_h])
-        #
-        # # データ送信バッファに追加
-        # self.add_command_queue(command)
-
     def get_limit_temperature(self, sid, callback=None):
         """温度リミットの取得 (℃)
 
@@ -1209,83 +1305,85 @@ class RobotisP20(Driver):
         # サーボIDのチェック
         self.__check_sid(sid)
 
-        # def response_process(response_data):
-        #     if response_data is not None and len(response_data) == 2:
-        #         limit_temp = int.from_bytes(response_data, 'little', signed=True)
-        #         return limit_temp
-        #     else:
-        #         raise InvalidResponseDataException('サーボからのレスポンスデータが不正です')
-        #
-        # return self.__get_function(self.ADDR_TEMPERATURE_LIMIT_L, self.FLAG30_MEM_MAP_SELECT, 2, response_process,
-        #                            sid=sid, callback=callback)
-
-    def get_limit_temperature_async(self, sid, loop=None):
-        """温度リミットの取得 (℃) async版
-
-        :param sid:
-        :param loop:
-        :return:
-        """
-
-        f, callback = self.async_wrapper(loop)
-        self.get_limit_temperature(sid, callback=callback)
-        return f
+    get_limit_temperature_async = async_method(get_limit_temperature)
 
     def set_limit_temperature(self, limit_temp, sid):
         """Futabaでは未サポート"""
         raise NotSupportException('Futabaではset_limit_temperatureに対応していません。')
 
     def set_burst_target_positions(self, sid_target_positions):
-        """複数のサーボの対象ポジションを一度に設定
+        """複数のサーボの対象ポジションを一度に設定 (Sync Write)
 
-        :param sid_target_positions:
+        :param sid_target_positions: {サーボID: 位置(度)}
         :return:
         """
 
-        # # データチェック & コマンドデータ生成
-        # vid_data = {}
-        # for sid, position_degree in sid_target_positions.items():
-        #     # サーボIDのチェック
-        #     self.__check_sid(sid)
-        #
-        #     # 設定可能な範囲は-150.0 度~+150.0 度
-        #     if position_degree < -150:
-        #         position_degree = -150
-        #     elif position_degree > 150:
-        #         position_degree = 150
-        #
-        #     position_hex = format(int(position_degree * 10) & 0xffff, '04x')
-        #     position_hex_h = int(position_hex[0:2], 16)
-        #     position_hex_l = int(position_hex[2:4], 16)
-        #
-        #     vid_data[sid] = [position_hex_l, position_hex_h]
-        #
-        # # コマンド生成
-        # command = self.__generate_burst_command(self.ADDR_GOAL_POSITION_L, 3, vid_data)
-        #
-        # # データ送信バッファに追加
-        # self.add_command_queue(command)
-        pass
+        # コマンド生成
+        command = self.__generate_sync_write_command(_ADDR_GOAL_POSITION, 4, len(sid_target_positions))
+
+        # サーボIDのチェック
+        self.__check_sids(sid_target_positions)
+
+        # データチェック & データ設定
+        offset = self.SYNC_WRITE_HEADER_LENGTH
+        count = len(sid_target_positions)
+        if np is not None and count >= NUMPY_SYNC_WRITE_THRESHOLD:
+            # サーボ数が多い場合はNumba/NumPyでまとめて変換し、ID(1) + Data(4)の並びを一度に書き込む
+            sids = np.fromiter(sid_target_positions.keys(), dtype=np.int64, count=count)
+            positions = np.fromiter(sid_target_positions.values(), dtype=np.float64, count=count)
+            if _encode_sync_write_positions is not None:
+                _encode_sync_write_positions(sids, positions,
+                                             np.frombuffer(command, dtype=np.uint8)[offset:offset + count * 5])
+            else:
+                vid_data = np.empty(count, dtype=np.dtype([('sid', 'u1'), ('position', '<u4')]))
+                vid_data['sid'] = sids
+                vid_data['position'] = np.rint((np.clip(positions, -180, 180) + 180) * _DEG_TO_RAW)
+                command[offset:offset + count * 5] = vid_data.tobytes()
+        else:
+            for sid, position_degree in sid_target_positions.items():
+                # 位置 (-180から180まで)
+                position_degree = max(-180, min(180, position_degree))
+
+                # Dynamixelでは0〜360°なので変換し、データ変換
+                position = int(round((position_degree + 180) * _DEG_TO_RAW))
+
+                struct.pack_into('<BI', command, offset, sid, position)
+                offset += 5
+
+        # Header部と一致するデータ列のうしろに0xFDを追加
+        stuffed_command = self.__stuff_command(command)
+
+        # Checksum (ヘッダー部まではキャッシュ済みのCRCの続きから計算。スタッフィングした場合は全体を計算)
+        if stuffed_command is command:
+            self.__set_checksum(command, self.SYNC_WRITE_HEADER_LENGTH,
+                                _sync_write_header_crc(_ADDR_GOAL_POSITION, 4, count))
+        else:
+            command = stuffed_command
+            self.__set_checksum(command)
+
+        # データ送信バッファに追加 (1パケットで全サーボに送信)
+        self.command_handler.add_command(command)
 
     def get_burst_positions(self, sids, callback=None):
-        """複数のサーボの現在のポジションを一気にリード
+        """複数のサーボの現在のポジションを一気にリード (Sync Read。単位: 度)
 
         :param sids:
         :param callback:
-        :return:
+        :return: {sid: 現在位置}
         """
-        """Futabaでは未サポート"""
-        raise NotSupportException('Futabaではget_burst_positionsに対応していません。')
 
-    def get_burst_positions_async(self, sids, loop=None):
-        """複数のサーボの現在のポジションを一気にリード async版
+        # サーボIDのチェック
+        sids = list(sids)
+        self.__check_sids(sids)
 
-        :param sids:
-        :param loop:
-        :return:
-        """
-        """Futabaでは未サポート"""
-        raise NotSupportException('Futabaではget_burst_positions_asyncに対応していません。')
+        if np is not None and len(sids) >= NUMPY_SYNC_READ_THRESHOLD:
+            # NumPyで全サーボ分をまとめて変換
+            return self.__sync_read(_ADDR_PRESENT_POSITION, 4, sids, _parse_positions_vectorized, callback=callback,
+                                    vectorized=True)
+
+        return self.__sync_read(_ADDR_PRESENT_POSITION, 4, sids, _parse_position, callback=callback)
+
+    get_burst_positions_async = async_method(get_burst_positions)
 
     def reset_memory(self, sid):
         """ROMを工場出荷時のものに初期化する
@@ -1297,12 +1395,6 @@ class RobotisP20(Driver):
         # サーボIDのチェック
         self.__check_sid(sid)
 
-        # # コマンド生成
-        # command = self.__generate_command(sid, self.ADDR_RESET_MEMORY, flag=self.FLAG4_RESET_MEMORY_MAP, count=0)
-        #
-        # # データ送信バッファに追加
-        # self.add_command_queue(command)
-
     def read(self, sid, address, length, callback=None):
         """データを読み込む
 
@@ -1316,46 +1408,67 @@ class RobotisP20(Driver):
         # サーボIDのチェック
         self.__check_sid(sid)
 
-        # def response_process(response_data):
-        #     if response_data is not None and len(response_data) == length:
-        #         return response_data
-        #     else:
-        #         raise InvalidResponseDataException('サーボからのレスポンスデータが不正です')
-        #
-        # return self.__get_function(address, self.FLAG30_MEM_MAP_SELECT, length, response_process,
-        #                            sid=sid, callback=callback)
+        # コマンド生成 (キャッシュ済みのREADコマンド)
+        command = _read_command(sid, address, length)
+
+        return self.__get_function(self.INSTRUCTION_READ, None, bytes, sid=sid, callback=callback,
+                                   command=command, response_length=length)
 
-    def read_async(self, sid, address, length, loop=None):
-        """データを読み込む async版
+    read_async = async_method(read)
+
+    def read_registers(self, sid, address_lengths, callback=None):
+        """複数のアドレスのデータを1回のREADでまとめて読み込む
+        指定したアドレスをすべて含む連続した範囲を読み込み、アドレスごとに分割して返す
 
         :param sid:
-        :param address:
-        :param length:
-        :param loop:
-        :return:
+        :param address_lengths: [(アドレス, データ長), ...]
+        :param callback:
+        :return: {アドレス: データ}
         """
 
-        f, callback = self.async_wrapper(loop)
-        self.read(sid, address, length, callback=callback)
-        return f
+        # サーボIDのチェック
+        self.__check_sid(sid)
+
+        address_lengths = list(address_lengths)
+        if len(address_lengths) == 0:
+            raise BadInputParametersException('address_lengths が空です')
+
+        # 読み込む範囲
+        start_address = min(address for address, _ in address_lengths)
+        end_address = max(address + length for address, length in address_lengths)
+
+        def response_process(response_data):
+            return {address: bytes(response_data[address - start_address:address - start_address + length])
+                    for address, length in address_lengths}
+
+        # コマンド生成 (キャッシュ済みのREADコマンド)
+        command = _read_command(sid, start_address, end_address - start_address)
+
+        return self.__get_function(self.INSTRUCTION_READ, None, response_process, sid=sid, callback=callback,
+                                   command=command, response_length=end_address - start_address)
+
+    read_registers_async = async_method(read_registers)
 
     def write(self, sid, address, data):
         """データを書き込む
 
         :param sid:
         :param address:
-        :param data:
+        :param data: 書き込むデータ(bytes, bytearray, memoryview, intのlistなど)
         :return:
         """
 
         # サーボIDのチェック
         self.__check_sid(sid)
 
-        # # コマンド生成
-        # command = self.__generate_command(sid, address, data)
-        #
-        # # データ送信バッファに追加
-        # self.add_command_queue(command)
+        # データのチェック (intを渡すとbytes(data)が0埋めのデータを作ってしまうため)
+        if isinstance(data, int):
+            raise BadInputParametersException('dataはbytesまたはintのlistで指定してください。')
+
+        # コマンド生成 (Address(2bytes) + Data。データはintに変換せずそのまま使う)
+        params = _pack_u16(address) + bytes(data)
+
+        return self.__get_function(self.INSTRUCTION_WRITE, params, sid=sid, callback=self.__callback_write_response)
 
     def burst_read(self, sid_address_length, callback=None):
         """複数サーボから一括でデータ読み取り
@@ -1364,7 +1477,6 @@ class RobotisP20(Driver):
         :param callback:
         :return:
         """
-        """Futabaでは未サポート"""
         raise NotSupportException('Futabaではburst_readに対応していません。')
 
     def burst_read_async(self, sid_address_length, loop=None):
@@ -1374,29 +1486,44 @@ class RobotisP20(Driver):
         :param loop:
         :return:
         """
-        """Futabaでは未サポート"""
         raise NotSupportException('Futabaではburst_read_asyncに対応していません。')
 
     def burst_write(self, address, length, sid_data):
-        """複数サーボに一括で書き込み
+        """複数サーボに一括で書き込み (Sync Write)
 
-        :param address:
-        :param length:
-        :param sid_data:
+        :param address: 書き込み先アドレス
+        :param length: サーボ1つ分のデータ長
+        :param sid_data: {サーボID: データ(lengthバイト)}
         :return:
         """
 
-        # # データチェック & コマンドデータ生成
-        # vid_data = {}
-        # for sid, data in sid_data.items():
-        #     # サーボIDのチェック
-        #     self.__check_sid(sid)
-        #
-        #     vid_data[sid] = data
-        #
-        # # コマンド生成
-        # command = self.__generate_burst_command(address, length, vid_data)
-        #
-        # # データ送信バッファに追加
-        # self.add_command_queue(command)
-        pass
+        # コマンド生成
+        command = self.__generate_sync_write_command(address, length, len(sid_data))
+
+        # サーボIDのチェック
+        self.__check_sids(sid_data)
+
+        # データチェック & データ設定
+        offset = self.SYNC_WRITE_HEADER_LENGTH
+        for sid, data in sid_data.items():
+            if len(data) != length:
+                raise BadInputParametersException('sid: %d のデータ長が不正です。%dバイトのデータを設定してください。'
+                                                  % (sid, length))
+
+            command[offset] = sid
+            command[offset + 1:offset + 1 + length] = bytes(data)
+            offset += 1 + length
+
+        # Header部と一致するデータ列のうしろに0xFDを追加
+        stuffed_command = self.__stuff_command(command)
+
+        # Checksum (ヘッダー部まではキャッシュ済みのCRCの続きから計算。スタッフィングした場合は全体を計算)
+        if stuffed_command is command:
+            self.__set_checksum(command, self.SYNC_WRITE_HEADER_LENGTH,
+                                _sync_write_header_crc(address, length, len(sid_data)))
+        else:
+            command = stuffed_command
+            self.__set_checksum(command)
+
+        # データ送信バッファに追加 (1パケットで全サーボに送信)
+        self.command_handler.add_command(command)
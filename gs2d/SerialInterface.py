@@ -1,9 +1,8 @@
 # ! /usr/bin/env python3
 # encoding: utf-8
 
-import platform
-import glob
 import serial
+from serial.tools import list_ports
 import logging
 
 from .ISerialInterface import ISerialInterface
@@ -15,6 +14,22 @@ logger = logging.getLogger(__name__)
 # デフォルトのボーレート
 DEFAULT_BAUDRATE = 115200
 
+# 自動検出するデバイス名に含まれる文字列
+_DEVICE_PATTERNS = ('usbserial', 'ttyUSB', 'ttyACM')
+
+
+def _find_device():
+    """USBシリアルデバイスを検索 (抜き差しやアダプタの追加に対応するため、オープンのたびに検索する)
+
+    :return: 最初に見つけたデバイス名
+    """
+
+    for port in list_ports.comports():
+        if any(pattern in port.device for pattern in _DEVICE_PATTERNS):
+            return port.device
+
+    raise SerialDeviceNotFoundException('シリアルデバイスを設定してください')
+
 
 class SerialInterface(ISerialInterface):
     __ser = None
@@ -28,23 +43,7 @@ class SerialInterface(ISerialInterface):
 
         # デバイス設定
         if device is None:
-            pf = platform.system()
-            base_path = None
-            if pf == 'Windows':
-                base_path = None
-            elif pf == 'Darwin':
-                base_path = '/dev/tty.usbserial-*'
-            elif pf == 'Linux':
-                base_path = '/dev/tty.usbserial-*'
-            if base_path:
-                devices = glob.glob(base_path)
-
-                if len(devices) > 0:
-                    device = devices[0]
-                else:
-                    raise SerialDeviceNotFoundException('シリアルデバイスを設定してください')
-            else:
-                raise SerialDeviceNotFoundException('シリアルデバイスを設定してください')
+            device = _find_device()
 
         # ボーレート設定
         if baudrate is None:
@@ -64,13 +63,23 @@ class SerialInterface(ISerialInterface):
 
         return self.__ser.write(data)
 
-    def read(self):
-        """サーボからのデータ1文字受信
+    def read(self, size=1):
+        """サーボからのデータ受信 (デフォルトは1文字)
 
+        :param size: 受信するバイト数
         :return:
         """
 
-        return self.__ser.read()
+        return self.__ser.read(size)
+
+    def read_into(self, buffer):
+        """サーボからのデータをbufferのサイズ分受信してbufferに書き込む
+
+        :param buffer: 書き込み先のbytearray/memoryview
+        :return: 受信したバイト数
+        """
+
+        return self.__ser.readinto(buffer)
 
     def is_open(self):
         """シリアルインタフェースがオープンされているかチェック
@@ -1,48 +1,97 @@
+# bytes.translateで変換するデータ長の下限 (ログ出力用の大きなデータ向け。短いデータはbytes.hexの方が速い)
+TRANSLATE_HEX_THRESHOLD = 1024
+
+# 1byteを上位4bit, 下位4bitの16進数の文字に変換するテーブル
+_HEX_HIGH_TABLE = bytes(b'0123456789ABCDEF'[i >> 4] for i in range(256))
+_HEX_LOW_TABLE = bytes(b'0123456789ABCDEF'[i & 0x0F] for i in range(256))
+
+
 class SerialServoDriverException(IOError):
     """Exceptionのベースクラス"""
 
+    __slots__ = ()
+
 
 class NotSupportException(IOError):
     """機能の未サポートException (サーボごとに実装されていない機能がある)"""
 
+    __slots__ = ()
+
 
 class SerialDeviceNotFoundException(SerialServoDriverException):
     """シリアルデバイスが見つからないException"""
 
+    __slots__ = ()
+
 
 class ReceiveDataTimeoutException(SerialServoDriverException):
     """データ受信タイムアウトException"""
 
+    __slots__ = ()
+
 
 class CloseTimeoutException(SerialServoDriverException):
     """クローズタイムアウトException"""
 
+    __slots__ = ()
+
 
 class CommandBufferOverflowException(SerialServoDriverException):
     """コマンド用バッファのオーバーフローException"""
 
+    __slots__ = ()
+
 
 class NotEnablePollingCommandException(SerialServoDriverException):
     """ポーリング無効時にコマンド追加したときのException"""
 
+    __slots__ = ()
+
 
 class BadInputParametersException(SerialServoDriverException):
     """入力パラメータがよくないException"""
 
+    __slots__ = ()
+
 
 class InvalidResponseDataException(SerialServoDriverException):
     """サーボからのレスポンスデータが不正なデータだったException"""
 
+    __slots__ = ()
+
 
 class WrongCheckSumException(SerialServoDriverException):
     """チェックサムが間違ってるException"""
 
+    __slots__ = ()
+
+
+class StatusErrorException(SerialServoDriverException):
+    """サーボのステータスパケットにエラーが設定されていたException"""
+
+    __slots__ = ()
+
 
 def get_printable_hex(byte_data):
     """
     bytearrayのデータを見やすい16進数表現の文字列に変換する
-    :param byte_data:
+    memoryviewも受け付けるので、一部だけ出力する場合はmemoryview(data)[start:stop]を渡せばコピーせずに済む
+    :param byte_data: bytes, bytearray, memoryview
     :return:
     """
-    data_hex_string = byte_data.hex()
-    return '[' + ' '.join([data_hex_string[i: i + 2].upper() for i in range(0, len(data_hex_string), 2)]) + ']'
+    # 大きなデータは上位/下位4bitをそれぞれtranslateで変換し、スライス代入で並べる
+    if len(byte_data) >= TRANSLATE_HEX_THRESHOLD:
+        if not isinstance(byte_data, (bytes, bytearray)):
+            # memoryviewなどはtranslateがないのでbytesにする
+            byte_data = bytes(byte_data)
+        size = len(byte_data)
+        out = bytearray(size * 3 + 1)
+        out[1::3] = byte_data.translate(_HEX_HIGH_TABLE)
+        out[2::3] = byte_data.translate(_HEX_LOW_TABLE)
+        out[3::3] = b' ' * size
+        out[0] = 0x5B
+        out[-1] = 0x5D
+        return out.decode('ascii')
+
+    # 1byteごとにスペースで区切った16進数の文字列をC実装のbytes.hexで生成
+    return '[%s]' % byte_data.hex(' ').upper()
@@ -1,4 +1,4 @@
-# from .Futaba import Futaba
+from .Futaba import Futaba
 from .RobotisP20 import RobotisP20
 from .SerialInterface import SerialInterface
 from .DefaultCommandHandler import DefaultCommandHandler
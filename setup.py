@@ -1,25 +1,31 @@
-import os
 from setuptools import setup, find_packages
 
+with open('README.md', encoding='utf-8') as f:
+    LONG_DESCRIPTION = f.read()
+
 
 def read_requirements():
-    """Parse requirements from requirements.txt."""
-    reqs_path = os.path.join('.', 'requirements.txt')
-    with open(reqs_path, 'r') as f:
-        requirements = [line.rstrip() for line in f]
-    return requirements
+    """Parse requirements from requirements.txt, dropping comments and blank lines."""
+    with open('requirements.txt', 'r', encoding='utf-8') as f:
+        lines = (line.split('#', 1)[0].strip() for line in f.read().splitlines())
+        return tuple(line for line in lines if line)
+
+
+REQUIREMENTS = read_requirements()
 
 
 setup(
     name='gs2d',
     version='0.0.4',
     description='gs2d: The Library for Generic Serial-bus Servo Driver kr-sac001 for Python',
-    long_description=open('README.md').read(),
+    long_description=LONG_DESCRIPTION,
     long_description_content_type='text/markdown',
     author='Karakuri Products',
     author_email='gs2d@krkrpro.com',
-    install_requires=read_requirements(),
+    install_requires=REQUIREMENTS,
     url='https://github.com/karakuri-products/gs2d-python',
     license='Apache License Version 2.0',
-    packages=find_packages(exclude=('tests', 'docs'))
+    packages=find_packages(exclude=('tests', 'docs')),
+    python_requires='>=3.8',
+    zip_safe=False
 )